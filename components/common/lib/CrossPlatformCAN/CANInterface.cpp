@@ -228,6 +228,15 @@ bool CANInterface::begin(long baudRate, const char* canDevice, int csPin, int in
   }
   
   printf("Debug: Socket bound to interface %s\n", canDevice);
+
+  // Only standard-ID data frames carry our protocol; let the kernel drop extended-ID
+  // and remote frames so they never wake the receive loop
+  struct can_filter filter;
+  filter.can_id = 0;
+  filter.can_mask = CAN_EFF_FLAG | CAN_RTR_FLAG;
+  if (setsockopt(m_socket, SOL_CAN_RAW, CAN_RAW_FILTER, &filter, sizeof(filter)) < 0) {
+    perror("CAN_RAW_FILTER failed"); // Not fatal: fall back to receiving every frame
+  }
   
   // Set non-blocking mode for reads
   int flags = fcntl(m_socket, F_GETFL, 0);
@@ -348,6 +357,13 @@ bool CANInterface::sendMessage(const CANMessage& msg) {
   frame.can_dlc = msg.length;
   memcpy(frame.data, msg.data, msg.length);
   
+  // Check socket validity
+  if (m_socket < 0) {
+    printf("ERROR: Invalid socket descriptor: %d\n", m_socket);
+    return false;
+  }
+
+  #if DEBUG_MODE // Per-frame diagnostics; costs three extra syscalls and several printfs per send
   printf("Debug: Sending CAN frame - ID: 0x%X, DLC: %d, Data:", 
          frame.can_id, frame.can_dlc);
   for (int i = 0; i < frame.can_dlc; i++) {
@@ -355,12 +371,6 @@ bool CANInterface::sendMessage(const CANMessage& msg) {
   }
   printf("\n");
   
-  // Check socket validity
-  if (m_socket < 0) {
-    printf("ERROR: Invalid socket descriptor: %d\n", m_socket);
-    return false;
-  }
-  
   // Log socket details
   int sock_type;
   socklen_t sock_type_len = sizeof(sock_type);
@@ -388,6 +398,9 @@ bool CANInterface::sendMessage(const CANMessage& msg) {
   }
   
   printf("Debug: About to write %zu bytes to socket %d\n", sizeof(struct can_frame), m_socket);
+  #endif
+
+  // The socket is non-blocking, so a full TX queue fails with EAGAIN and the frame is dropped
   int nbytes = write(m_socket, &frame, sizeof(struct can_frame));
   
   if (nbytes < 0) {
@@ -398,7 +411,9 @@ bool CANInterface::sendMessage(const CANMessage& msg) {
     return false;
   }
   
+  #if DEBUG_MODE
   printf("Debug: Successfully wrote %d bytes to socket\n", nbytes);
+  #endif
   return true;
 #endif
   
@@ -439,6 +454,14 @@ bool CANInterface::messageAvailable() {
   return false;
 }
 
+int CANInterface::getFileDescriptor() const {
+#if defined(PLATFORM_LINUX) || defined(PLATFORM_DARWIN)
+  return m_socket;
+#else
+  return -1;
+#endif
+}
+
 bool CANInterface::receiveMessage(CANMessage& msg) {
 #ifdef PLATFORM_ARDUINO
   // Check if there's a message available
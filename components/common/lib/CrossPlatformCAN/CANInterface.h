@@ -112,6 +112,14 @@ public:
    */
   bool messageAvailable();
 
+  /**
+   * Get the file descriptor frames are received on, so callers can block in
+   * select()/poll() until one arrives instead of polling
+   * 
+   * @return the socket descriptor, or -1 if the platform has none or it isn't open
+   */
+  int getFileDescriptor() const;
+
 private:
 #ifdef PLATFORM_ESP32
   MCP2515 m_mcp2515; // Instance of the MCP2515 library object
@@ -41,6 +41,11 @@ bool ProtobufCANInterface::begin(long baudRate, const char* canDevice)
     return m_canInterface.begin(baudRate, canDevice, m_csPin, m_intPin);
 }
 
+int ProtobufCANInterface::getFileDescriptor() const
+{
+    return m_canInterface.getFileDescriptor();
+}
+
 void ProtobufCANInterface::registerHandler(kart_common_MessageType msg_type,
                                           kart_common_ComponentType type, 
                                           uint8_t component_id, 
@@ -157,18 +162,18 @@ bool ProtobufCANInterface::sendMessage(kart_common_MessageType message_type,
     return result;
 }
 
-void ProtobufCANInterface::process()
+bool ProtobufCANInterface::process()
 {
     CANMessage msg;
     
     // Try to receive a message
     if (!m_canInterface.receiveMessage(msg)) {
-        return; // No message available
+        return false; // No message available
     }
     
     // Message must be 8 bytes for our protocol
     if (msg.length != 8) {
-        return;
+        return true;
     }
 
     // Peek at message type and command ID first for special handling
@@ -194,9 +199,11 @@ void ProtobufCANInterface::process()
     // --- Handle Time Sync Commands --- 
     if (comp_type == kart_common_ComponentType_SYSTEM_MONITOR) {
         if (msg_type == kart_common_MessageType_COMMAND && command_id == kart_system_monitor_SystemMonitorCommandId_PING) {
-            return _handlePing(msg, value);
+            _handlePing(msg, value);
+            return true;
         } else if (msg_type == kart_common_MessageType_COMMAND && command_id == kart_system_monitor_SystemMonitorCommandId_SET_TIME) {
-            return _handleSetTime(msg);
+            _handleSetTime(msg);
+            return true;
         }
     }
 
@@ -216,6 +223,7 @@ void ProtobufCANInterface::process()
     if (handlerFound && msg_type == kart_common_MessageType_COMMAND) {
        sendMessage(kart_common_MessageType_STATUS, comp_type, component_id, command_id, value_type, value);
     }
+    return true;
 }
 
 uint8_t ProtobufCANInterface::packHeader(kart_common_MessageType type, kart_common_ComponentType component)
@@ -91,8 +91,15 @@ public:
   /**
    * Process incoming messages
    * Should be called regularly in the main loop
+   * 
+   * @return true if a frame was read from the bus, false if none was pending
+   */
+  bool process();
+
+  /**
+   * Get the file descriptor incoming frames arrive on (-1 if there is none)
    */
-  void process();
+  int getFileDescriptor() const;
   
   /**
    * Helper function to pack a header byte
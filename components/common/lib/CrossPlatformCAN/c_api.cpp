@@ -114,4 +114,28 @@ EXPORT void can_interface_process(can_interface_t handle) {
     interface->process();
 }
 
+EXPORT int can_interface_process_all(can_interface_t handle, int max_messages) {
+    if (!handle) {
+        printf("C API ERROR: Null handle in can_interface_process_all\n");
+        return 0;
+    }
+    
+    ProtobufCANInterface* interface = static_cast<ProtobufCANInterface*>(handle);
+    int processed = 0;
+    while (processed < max_messages && interface->process()) {
+        processed++;
+    }
+    return processed;
+}
+
+EXPORT int can_interface_get_fd(can_interface_t handle) {
+    if (!handle) {
+        printf("C API ERROR: Null handle in can_interface_get_fd\n");
+        return -1;
+    }
+    
+    ProtobufCANInterface* interface = static_cast<ProtobufCANInterface*>(handle);
+    return interface->getFileDescriptor();
+}
+
 }  // extern "C"
\ No newline at end of file
@@ -41,6 +41,10 @@ bool can_interface_send_message(
     uint32_t destination_node_id
 );
 void can_interface_process(can_interface_t handle);
+// Process up to max_messages pending frames; returns how many were read
+int can_interface_process_all(can_interface_t handle, int max_messages);
+// Descriptor incoming frames arrive on, for select()/poll(); -1 if there is none
+int can_interface_get_fd(can_interface_t handle);
 
 #ifdef __cplusplus
 }
@@ -28,8 +28,20 @@ def create_header_byte(message_type, component_type):
     # Message type is 2 bits (bits 7-6), component type is 3 bits (bits 5-3)
     return (message_type << 6) | (component_type << 3)
 
+def can_interface_is_up(device="can0"):
+    """Check the interface's IFF_UP flag in sysfs without spawning a process"""
+    try:
+        with open(f"/sys/class/net/{device}/flags") as f:
+            return bool(int(f.read().strip(), 16) & 0x1)
+    except (OSError, ValueError):
+        return False
+
 def reset_can_interface(device="can0"):
     """Reset the CAN interface to make sure it's in a good state"""
+    # Skip the sudo down/up cycle (and its 1 s of sleeps) when the interface is already up
+    if can_interface_is_up(device):
+        print(f"CAN interface {device} is already up")
+        return True
     print(f"Resetting CAN interface {device}...")
     try:
         subprocess.run(["sudo", "ip", "link", "set", device, "down"], check=True)
@@ -5,9 +5,17 @@ API routes for sending commands to the go-kart
 from flask import jsonify, request, Blueprint
 import logging
 from shared.lib.python.can.interface import CANInterfaceWrapper
+from api import fast_json
 
 logger = logging.getLogger(__name__)
 
+# Fixed error bodies are serialized once at import; failure branches only wrap them
+_ERR_INVALID_BODY = fast_json.dumps({'status': 'error', 'message': 'Request body must be a JSON object'})
+_ERR_MISSING_FIELDS = fast_json.dumps({
+    'status': 'error',
+    'message': 'component_type, component_name and command_name are required'
+})
+
 def register_command_routes(app, can_interface: CANInterfaceWrapper):
     """Register API routes for commanding the go-kart"""
     
@@ -18,8 +26,14 @@ def register_command_routes(app, can_interface: CANInterfaceWrapper):
     def send_command():
         """Send a command to the go-kart"""
         try:
-            command_data = request.json
-            logger.info(f"Received command request: {command_data}")
+            # Parse the raw body directly; skips Flask's mimetype check and stdlib decoder
+            try:
+                command_data = fast_json.loads(request.get_data(cache=False))
+            except ValueError:
+                return fast_json.response(_ERR_INVALID_BODY, 400)
+            if not isinstance(command_data, dict):
+                return fast_json.response(_ERR_INVALID_BODY, 400)
+            logger.info("Received command request: %s", command_data)
             
             # Extract parameters with defaults for missing fields
             component_type = command_data.get('component_type')
@@ -27,20 +41,22 @@ def register_command_routes(app, can_interface: CANInterfaceWrapper):
             command_name = command_data.get('command_name')
             value_name = command_data.get('value_name')
             direct_value = command_data.get('direct_value')
+            if not (component_type and component_name and command_name):
+                return fast_json.response(_ERR_MISSING_FIELDS, 400)
             
             # For backward compatibility with older frontend
             if 'value' in command_data and direct_value is None:
                 direct_value = command_data['value']
             
-            # Build component path (e.g., "lights.front")
-            component_path = f"{component_type.lower()}.{component_name}" if component_type and component_name else None
+            # Build component path (e.g., "lights.front"); both parts were validated above
+            component_path = f"{component_type.lower()}.{component_name}"
             
             # Log the parsed command
-            logger.info(f"Sending command: {component_path}.{command_name} = {value_name} ({direct_value})")
+            logger.info("Sending command: %s.%s = %s (%s)", component_path, command_name, value_name, direct_value)
             
             # Call the CAN interface with all required parameters
-            # Ensure direct_value is an integer if provided
-            if direct_value is not None:
+            # Ensure direct_value is an integer if provided; JSON numbers usually already are
+            if direct_value is not None and type(direct_value) is not int:
                 try:
                     direct_value = int(direct_value)
                 except (ValueError, TypeError):
@@ -50,8 +66,6 @@ def register_command_routes(app, can_interface: CANInterfaceWrapper):
                         "message": "direct_value must be an integer",
                         "details": {"direct_value": direct_value}
                     }), 400
-                
-            logger.info(f"component_type: {component_type}, component_name: {component_name}, command_name: {command_name}, value_name: {value_name}, direct_value: {direct_value}")
 
             result = can_interface.send_command(
                 message_type_name='COMMAND',
@@ -63,7 +77,7 @@ def register_command_routes(app, can_interface: CANInterfaceWrapper):
                 direct_value=direct_value
             )
 
-            return jsonify({
+            return fast_json.jsonify({
                 'status': 'success' if result else 'error',
                 'message': 'Command sent successfully' if result else 'Command failed',
                 'details': {
@@ -1,9 +1,13 @@
 from flask import jsonify, request, Blueprint
 import logging
 from shared.lib.python.can.interface import CANInterfaceWrapper
+from api import fast_json
 
 logger = logging.getLogger(__name__)
 
+# Serialized once at import; the failure branch only wraps it
+_ERR_INVALID_BODY = fast_json.dumps({"status": "error", "message": "Request body must be a JSON object"})
+
 def register_direct_command_routes(app, can_interface):
     # Create a blueprint for direct command routes
     direct_command_bp = Blueprint('direct_command', __name__, url_prefix='/api/direct_command')
@@ -11,7 +15,13 @@ def register_direct_command_routes(app, can_interface):
     @direct_command_bp.route("", methods=["POST"])
     def send_direct_command():
         try:
-            command_data = request.json
+            # Parse the raw body directly; skips Flask's mimetype check and stdlib decoder
+            try:
+                command_data = fast_json.loads(request.get_data(cache=False))
+            except ValueError:
+                return fast_json.response(_ERR_INVALID_BODY, 400)
+            if not isinstance(command_data, dict):
+                return fast_json.response(_ERR_INVALID_BODY, 400)
             logger.info(f"Received direct command request: {command_data}")
             
             msg_type = int(command_data.get("msg_type", 0))
@@ -32,7 +42,7 @@ def register_direct_command_routes(app, can_interface):
                 value
             )
 
-            return jsonify({
+            return fast_json.jsonify({
                 "status": "success" if result else "error",
                 "message": "Direct command sent successfully" if result else "Direct command failed",
                 "details": {
@@ -1,21 +1,25 @@
+# Patch blocking stdlib I/O before anything else is imported so the collector
+# polling, CAN processing and Socket.IO emits share one green-thread scheduler
+import eventlet
+eventlet.monkey_patch()
+
 import time
+import gzip
+import hashlib
 import logging
 import threading
-import os
-import sys
 import requests # Import requests library
-from flask import Flask, Blueprint, render_template
-from flask_socketio import SocketIO
-from flask_cors import CORS
+from requests.adapters import HTTPAdapter
+from flask import Blueprint, request
+from flask_socketio import emit
 
 from shared.lib.python.can.interface import CANInterfaceWrapper
 from shared.lib.python.can.protocol_registry import ProtocolRegistry
 from shared.lib.python.telemetry.persistent_store import TelemetryStore
 
-from api.telemetry import register_telemetry_routes
-from api.commands import register_command_routes
-from api.direct_commands import register_direct_command_routes
-from api.protocol import register_protocol_routes
+from api.telemetry import cache_current_state, fetch_history_rows
+from api import fast_json
+from app_factory import create_app
 
 # Let ProtocolRegistry autodetect the path
 protocol_path = None
@@ -26,7 +30,8 @@ telemetry_store = TelemetryStore(protocol=protocol_registry)
 can_interface = CANInterfaceWrapper(
     node_id=0x01, 
     channel='can0', 
-    telemetry_store=telemetry_store
+    telemetry_store=telemetry_store,
+    protocol_registry=protocol_registry
 )
 
 # Start automatic message processing
@@ -36,116 +41,269 @@ can_interface.start_processing()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-app = Flask(__name__, static_folder='../static', template_folder='../templates')
-CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Initialize Flask app, Socket.IO and the API routes
+app, socketio = create_app(telemetry_store, can_interface, protocol_registry)
 
 # Setup API routes
 api = Blueprint('api', __name__)
 
-# Background thread for sending periodic state updates
-update_thread = None
+# Background task for sending periodic state updates
+update_task_running = False
 thread_lock = threading.Lock()
 
 # Variables for background thread
-UPDATE_INTERVAL = 0.1  # seconds
+UPDATE_INTERVAL = 0.1  # seconds to pause after a poll that brought no new state
+STATE_WAIT = 1.0  # seconds the collector may hold a request until the state changes
+BROADCAST_CHUNK_SIZE = 50  # clients per emit batch before yielding
+BATCH_INTERVAL = 0.02  # seconds a state_batch stays open after its first state
+BATCH_MAX_SAMPLES = 128  # send early once this many states are waiting (bounds the frame size)
+MAX_CLIENT_BACKLOG = 4  # packets queued for a client before its batches are dropped
+dropped_batches = 0  # batches skipped for clients that weren't keeping up
+HISTORY_CHUNK_SIZE = 200  # history rows per history_chunk event
+HISTORY_MAX_ROWS = 600  # rows sent in answer to a history_request
 clients_connected = False
+client_count = 0  # connected Socket.IO clients, guarded by thread_lock
 running = True
+# Last collector state sent to clients; unchanged polls are not re-broadcast
+last_state_body = None
+last_state = None
+# Batches carry only the fields that changed since the state before them; the last state
+# broadcast and the clients that received it (everyone else is sent full states)
+last_broadcast_state = None
+synced_sids = set()
 # state_history = [] # Remove dashboard-local history
 
 # Define Telemetry Collector API URL (ideally from config/env)
 COLLECTOR_API_URL = "http://localhost:5001" # Default from collector config
 
+# Keep-alive session for the update task so each poll reuses one collector connection
+collector_session = requests.Session()
+collector_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
+
+# The page takes no template context, so it is rendered and compressed once at startup
+index_body = app.jinja_env.get_template('index.html').render().encode('utf-8')
+index_etag = hashlib.sha1(index_body).hexdigest()
+index_body_gz = gzip.compress(index_body, compresslevel=9)
+
 # Home page route
 @app.route('/')
 def index():
-    """Render the dashboard."""
+    """Serve the dashboard."""
     logger.debug("Index route accessed!")
-    try:
-        return render_template('index.html')
-    except Exception as e:
-        logger.debug(f"Error rendering template: {e}")
-        return f"Error: {e}", 500
+    if 'gzip' in request.accept_encodings:
+        response = app.response_class(index_body_gz, mimetype='text/html')
+        response.content_encoding = 'gzip'
+        response.set_etag(index_etag + '-gzip')
+    else:
+        response = app.response_class(index_body, mimetype='text/html')
+        response.set_etag(index_etag)
+    response.vary.add('Accept-Encoding')
+    # Revalidate on each load; an unchanged page comes back as an empty 304
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 # Register blueprint
 app.register_blueprint(api)
 
-# Register routes from the other modules
-register_telemetry_routes(app, telemetry_store, can_interface)
-register_command_routes(app, can_interface)
-register_direct_command_routes(app, can_interface)
-register_protocol_routes(app, protocol_registry)
-
 # Socket.IO handlers
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection."""
-    global clients_connected, update_thread
+    global clients_connected, client_count
     
     logger.info("Client connected")
-    clients_connected = True
-    
-    # Start the update thread if it's not already running
     with thread_lock:
-        if update_thread is None or not update_thread.is_alive():
-            update_thread = threading.Thread(target=send_updates, daemon=True)
-            update_thread.start()
-            logger.info("Started update thread")
+        client_count += 1
+        clients_connected = True
+
+    # Broadcasts are skipped while the state is unchanged, so seed the new client
+    if last_state is not None:
+        emit('state_update', last_state)
+    
+    # Start the update task if it's not already running
+    start_update_task()
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection."""
-    global clients_connected
+    global clients_connected, client_count
     
     logger.info("Client disconnected")
     # Check if there are still clients connected
-    clients_connected = len(socketio.server.manager.rooms.get('/', [])) > 0
+    with thread_lock:
+        client_count = max(client_count - 1, 0)
+        clients_connected = client_count > 0
+
+
+@socketio.on('history_request')
+def handle_history_request():
+    """Stream recent history to the requesting client in chunks, newest first, then signal the end."""
+    # Each page goes out as soon as it arrives, so encoding and sending overlap the next fetch
+    for offset in range(0, HISTORY_MAX_ROWS, HISTORY_CHUNK_SIZE):
+        try:
+            rows = fetch_history_rows(HISTORY_CHUNK_SIZE, offset)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Error fetching history from Telemetry Collector: {e}")
+            break
+        if rows:
+            emit('history_chunk', rows)
+        if len(rows) < HISTORY_CHUNK_SIZE:
+            break
+    emit('history_end')
+
+
+def client_backlog(eio_sid):
+    """Return the number of packets queued for a client that its transport hasn't written yet."""
+    # Engine.IO has no public accessor for its send queues; if its internals differ from the
+    # pinned versions, treat the client as caught up rather than dropping its batches
+    try:
+        eio_socket = socketio.server.eio.sockets.get(eio_sid)
+        return eio_socket.queue.qsize() if eio_socket is not None else 0
+    except (AttributeError, TypeError, NotImplementedError):
+        return 0
+
+
+def state_deltas(states, previous):
+    """Reduce each state to the fields that differ from the state before it (all fields if there is none)."""
+    deltas = []
+    for state in states:
+        if previous is None:
+            deltas.append(state)
+        else:
+            deltas.append({key: value for key, value in state.items() if previous.get(key) != value})
+        previous = state
+    return deltas
+
+
+def emit_batch(payload, sids):
+    """Emit a state_batch payload to the given clients, yielding between chunks of clients."""
+    for i in range(0, len(sids), BROADCAST_CHUNK_SIZE):
+        # A list of sids is encoded once and sent to each of them
+        socketio.emit('state_batch', payload, to=sids[i:i + BROADCAST_CHUNK_SIZE])
+        if i + BROADCAST_CHUNK_SIZE < len(sids):
+            # Let other handlers run before serving the next chunk
+            socketio.sleep(0)
+
+
+def broadcast_states(states):
+    """Emit a batch of state updates to all clients that are keeping up.
+
+    Clients that received the previous batch get only the changed fields of each state;
+    new clients and clients that missed a batch get full states so they can resync.
+    """
+    global dropped_batches, last_broadcast_state, synced_sids
+
+    # (sid, Engine.IO sid) for every client connected to the default namespace
+    clients = list(socketio.server.manager.get_participants('/', None))
+    # A stalled client's send queue would otherwise grow without bound; skip that client
+    # until its queue drains, then resync it with full states
+    sids = [sid for sid, eio_sid in clients if client_backlog(eio_sid) <= MAX_CLIENT_BACKLOG]
+    if len(sids) < len(clients):
+        dropped_batches += len(clients) - len(sids)
+        logger.debug("Dropped state batch for %d slow client(s), %d dropped in total",
+                     len(clients) - len(sids), dropped_batches)
+
+    delta_sids = [sid for sid in sids if sid in synced_sids]
+    full_sids = [sid for sid in sids if sid not in synced_sids]
+    if delta_sids:
+        emit_batch(state_deltas(states, last_broadcast_state), delta_sids)
+    if full_sids:
+        emit_batch(states, full_sids)
+
+    last_broadcast_state = states[-1]
+    # Skipped and disconnected clients drop out and are resynced on their next batch
+    synced_sids = set(sids)
+
+
+def start_update_task():
+    """Start the state update task on the Socket.IO scheduler if it isn't already running."""
+    global update_task_running
+
+    with thread_lock:
+        if not update_task_running:
+            update_task_running = True
+            socketio.start_background_task(send_updates)
+            logger.info("Started update task")
 
 
 def send_updates():
     """Send periodic state updates to connected clients by fetching from Telemetry Collector."""
-    global running, clients_connected
+    global running, clients_connected, update_task_running, last_state_body, last_state
+    global last_broadcast_state, synced_sids
 
-    logger.info("Starting update thread (fetching from collector)")
+    logger.info("Starting update task (fetching from collector)")
     running = True
-    last_update_time = time.time()
+    # Changed states waiting to go out together in one state_batch emit, and when the
+    # first of them arrived
+    pending_states = []
+    batch_started = 0.0
+
+    try:
+        while running and clients_connected:
+            # One frame per batch amortizes Socket.IO packet and client dispatch overhead over
+            # every state that changed within BATCH_INTERVAL of the first one
+            now = time.monotonic()
+            if pending_states and (len(pending_states) >= BATCH_MAX_SAMPLES or
+                                   now - batch_started >= BATCH_INTERVAL):
+                broadcast_states(pending_states)
+                pending_states = []
 
-    while running and clients_connected:
-        current_time = time.time()
-        if current_time - last_update_time >= UPDATE_INTERVAL:
             try:
-                # Fetch the current state from the Telemetry Collector API
-                response = requests.get(f"{COLLECTOR_API_URL}/api/state/current", timeout=0.5) # Add timeout
+                # Once we have a state, the collector holds the request until a newer one
+                # arrives. With nothing queued it may wait up to STATE_WAIT; while a batch is
+                # open only for the rest of its window, so each change within the window is
+                # fetched as soon as it happens and the batch still goes out on time
+                params = None
+                if last_state is not None:
+                    wait = STATE_WAIT
+                    if pending_states:
+                        wait = max(BATCH_INTERVAL - (now - batch_started), 0.001)
+                    params = {'since': last_state.get('timestamp'), 'wait': wait}
+                response = collector_session.get(f"{COLLECTOR_API_URL}/api/state/current", params=params,
+                                                 timeout=params['wait'] + 0.5 if params else 0.5)
                 response.raise_for_status() # Raise exception for bad status codes (4xx or 5xx)
-                state = response.json()
-
-                # Send the fetched state to all connected clients
-                socketio.emit('state_update', state)
-                last_update_time = current_time
+                body = response.content
+                cache_current_state(body)
 
-                # Remove local history management
-                # state_history.append(state)
-                # if len(state_history) > 1000:
-                #     state_history.pop(0)
+                # Only parse and queue the state for connected clients when it changed
+                if body != last_state_body:
+                    last_state = fast_json.loads(body)
+                    last_state_body = body
+                    if not pending_states:
+                        batch_started = time.monotonic()
+                    pending_states.append(last_state)
+                    # Go straight back to the collector for the next change
+                    continue
 
             except requests.exceptions.Timeout:
                  logger.warning("Timeout fetching state from Telemetry Collector.")
             except requests.exceptions.ConnectionError:
                 logger.error("Connection error fetching state from Telemetry Collector. Is it running?")
                 # Optional: Sleep longer if connection fails repeatedly
-                time.sleep(2.0)
+                socketio.sleep(2.0)
             except requests.exceptions.RequestException as e:
                 logger.error(f"Error fetching state from Telemetry Collector: {e}")
-                time.sleep(1.0) # Longer sleep on other request errors
+                socketio.sleep(1.0) # Longer sleep on other request errors
             except Exception as e:
-                logger.error(f"Error in update thread: {e}", exc_info=True)
-                time.sleep(1.0) # Longer sleep on general error
+                logger.error(f"Error in update task: {e}", exc_info=True)
+                socketio.sleep(1.0) # Longer sleep on general error
 
-        # Sleep a bit to avoid hogging CPU, especially if requests fail quickly
-        time.sleep(0.05)
+            # Unchanged answer: the wait ran out, or a collector without long polling answered
+            # at once. Pause so the latter can't turn this into a busy loop; with a batch open,
+            # only until its window closes
+            if pending_states:
+                socketio.sleep(max(BATCH_INTERVAL - (time.monotonic() - batch_started), 0))
+            else:
+                socketio.sleep(UPDATE_INTERVAL)
+    finally:
+        with thread_lock:
+            update_task_running = False
+        last_state_body = None
+        last_state = None
+        last_broadcast_state = None
+        synced_sids = set()
 
-    logger.info("Update thread stopped")
+    logger.info("Update task stopped")
 
 if __name__ == "__main__":
     # Start the server
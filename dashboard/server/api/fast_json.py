@@ -0,0 +1,33 @@
+"""
+JSON helpers for the dashboard API
+
+loads()/dumps() come from shared.lib.python.fast_json (orjson when installed, stdlib json
+otherwise); this module adds the Flask and Socket.IO glue around them.
+"""
+
+from flask import current_app
+
+from shared.lib.python.fast_json import has_orjson, loads, dumps  # noqa: F401 (re-exported)
+
+
+class SocketIOJSON:
+    """json-module stand-in for python-socketio packets, which expect dumps() to return str"""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        # Packet code passes separators=(',', ':'); both encoders already emit compact JSON here
+        return dumps(obj).decode('utf-8')
+
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return loads(data)
+
+
+def response(body: bytes, status: int = 200):
+    """Wrap already-serialized JSON bytes in a response without re-encoding them"""
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+def jsonify(obj, status: int = 200):
+    """Drop-in for flask.jsonify that serializes with dumps()"""
+    return response(dumps(obj), status)
@@ -2,9 +2,12 @@
 API routes for viewing and exploring the protocol structure
 """
 
-from flask import jsonify, render_template, Blueprint
+from flask import jsonify, Blueprint, request
+import gzip
+import hashlib
 import logging
 from shared.lib.python.can.protocol_registry import ProtocolRegistry
+from api import fast_json
 
 logger = logging.getLogger(__name__)
 
@@ -13,11 +16,22 @@ def register_protocol_routes(app, protocol_registry: ProtocolRegistry):
     protocol_view_bp = Blueprint('protocol_view', __name__, url_prefix='/protocol')
     protocol_api_bp = Blueprint('protocol_api', __name__, url_prefix='/api/protocol')
 
+    # Compiled once here; the page needs no request context so it renders without the loader
+    protocol_template = app.jinja_env.get_template('protocol.html')
+
+    # The registry is fixed once built, so its JSON body is serialized on first request only
+    registry_json = {}
+    # Serialized bodies for names that resolved, keyed the way the registry normalizes
+    # them so other spellings of the same name share one entry; misses aren't cached so
+    # arbitrary URLs can't grow these
+    component_json = {}
+    command_json = {}
+
     @protocol_view_bp.route('', methods=['GET'])
     def protocol():
         """Render the protocol documentation page"""
         try:
-            return render_template('protocol.html')
+            return protocol_template.render()
         except Exception as e:
             logger.error(f"Error retrieving protocol structure: {e}")
             return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -26,7 +40,23 @@ def register_protocol_routes(app, protocol_registry: ProtocolRegistry):
     def get_protocol_structure_api():
         """Get the complete protocol structure"""
         try:
-            return jsonify(protocol_registry.registry)
+            if 'body' not in registry_json:
+                registry_json['body'] = fast_json.dumps(protocol_registry.registry)
+                registry_json['etag'] = hashlib.sha1(registry_json['body']).hexdigest()
+                registry_json['body_gz'] = gzip.compress(registry_json['body'], compresslevel=6)
+            if 'gzip' in request.accept_encodings:
+                # Compressed once with the body; each encoding gets its own validator
+                response = fast_json.response(registry_json['body_gz'])
+                response.content_encoding = 'gzip'
+                response.set_etag(registry_json['etag'] + '-gzip')
+            else:
+                response = fast_json.response(registry_json['body'])
+                response.set_etag(registry_json['etag'])
+            response.vary.add('Accept-Encoding')
+            response.cache_control.public = True
+            response.cache_control.max_age = 300
+            # Answers If-None-Match with an empty 304 when the client's copy is current
+            return response.make_conditional(request)
         except Exception as e:
             logger.error(f"Error retrieving protocol structure: {e}")
             return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -35,9 +65,14 @@ def register_protocol_routes(app, protocol_registry: ProtocolRegistry):
     def get_component_api(component_name):
         """Get protocol information for a specific component"""
         try:
+            key = component_name.lower()
+            body = component_json.get(key)
+            if body is not None:
+                return fast_json.response(body)
             component = protocol_registry.get_component_by_name(component_name)
             if component:
-                return jsonify(component)
+                body = component_json[key] = fast_json.dumps(component)
+                return fast_json.response(body)
             return jsonify({'status': 'error', 'message': f"Component '{component_name}' not found"}), 404
         except Exception as e:
             logger.error(f"Error retrieving component '{component_name}': {e}")
@@ -47,9 +82,14 @@ def register_protocol_routes(app, protocol_registry: ProtocolRegistry):
     def get_command_api(component_name, command_name):
         """Get protocol information for a specific command"""
         try:
+            key = (component_name.lower(), command_name.upper())
+            body = command_json.get(key)
+            if body is not None:
+                return fast_json.response(body)
             command = protocol_registry.get_command_by_name(component_name, command_name)
             if command:
-                return jsonify(command)
+                body = command_json[key] = fast_json.dumps(command)
+                return fast_json.response(body)
             return jsonify({'status': 'error', 'message': f"Command '{command_name}' not found for component '{component_name}'"}), 404
         except Exception as e:
             logger.error(f"Error retrieving command '{component_name}.{command_name}': {e}")
@@ -2,39 +2,116 @@
 API routes for getting telemetry data from the go-kart
 """
 
-from flask import jsonify, Blueprint, render_template, request
+from flask import jsonify, Blueprint, request, current_app
 import logging
+import threading
 import time
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
 from shared.lib.python.telemetry.store import TelemetryStore
 from shared.lib.python.can.interface import CANInterfaceWrapper
+from api import fast_json
 
 logger = logging.getLogger(__name__)
 
 # Telemetry Collector API URL
 COLLECTOR_API_URL = "http://localhost:5001"
 
+# Keep-alive session shared by the telemetry routes so collector calls reuse pooled connections
+collector_session = requests.Session()
+collector_session.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0))
+collector_session.headers['Connection'] = 'keep-alive'
+
+# Latest collector state body fetched by the dashboard update task, as (monotonic time, JSON bytes)
+_cached_state = (0.0, None)
+STATE_CACHE_TTL = 0.2  # seconds, two dashboard update intervals
+
+# Last /status body as (expiry monotonic time, JSON bytes); bursts of polls share one fetch
+_cached_status = (0.0, None)
+_status_lock = threading.Lock()
+STATUS_CACHE_TTL = 0.25  # seconds
+
+# Columns shown by /api/telemetry/stream when the collector has no history to sample
+DEFAULT_STATE_FIELDS = ['timestamp', 'message_type', 'component_type',
+                        'component_id', 'command_id', 'value_type', 'value']
+STATE_FIELDS_TTL = 60.0  # seconds between collector schema probes
+
+# Last (last_update, formatted) pair for the status fallback; strftime only reruns on change
+_last_update_formatted = (0, 'Never')
+
+def format_last_update(last_update) -> str:
+    """Format a last-update timestamp for display, reusing the previous result if unchanged"""
+    global _last_update_formatted
+    if not last_update:
+        return 'Never'
+    cached_update, formatted = _last_update_formatted
+    if last_update != cached_update:
+        formatted = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(last_update))
+        _last_update_formatted = (last_update, formatted)
+    return formatted
+
+def cache_current_state(body: bytes):
+    """Record the raw JSON body of the collector's current state so /state can reuse it"""
+    global _cached_state
+    _cached_state = (time.monotonic(), body)
+
+def fetch_history_rows(limit: int, offset: int = 0) -> list:
+    """Fetch one page of history rows from the collector, newest first"""
+    response = collector_session.get(
+        f"{COLLECTOR_API_URL}/api/state/history",
+        params={'limit': limit, 'offset': offset},
+        timeout=1.0
+    )
+    response.raise_for_status()
+    return fast_json.loads(response.content)
+
 def register_telemetry_routes(app, telemetry_store: TelemetryStore, can_interface: CANInterfaceWrapper):
     """Register API routes for telemetry data"""
     
     # Create a blueprint for telemetry routes
     telemetry_bp = Blueprint('telemetry', __name__, url_prefix='/api/telemetry')
+
+    # Template context for /stream; the collector schema rarely changes so it is probed at most
+    # once per STATE_FIELDS_TTL instead of on every page load
+    stream_ctx = {'state_fields': DEFAULT_STATE_FIELDS, 'collector_url': COLLECTOR_API_URL}
+    stream_ctx_expires = [0.0]
+    stream_template = app.jinja_env.get_template('telemetry_stream.html')
+
+    def refresh_state_fields():
+        """Sample one history entry from the collector to determine the stream columns"""
+        try:
+            response = collector_session.get(f"{COLLECTOR_API_URL}/api/state/history?limit=1", timeout=0.5)
+            response.raise_for_status()
+            history_data = response.json()
+            if history_data and len(history_data) > 0:
+                stream_ctx['state_fields'] = list(history_data[0].keys())
+            else:
+                stream_ctx['state_fields'] = DEFAULT_STATE_FIELDS
+        except:
+            # Keep the last known fields if collector unavailable
+            pass
+        stream_ctx_expires[0] = time.monotonic() + STATE_FIELDS_TTL
     
     @telemetry_bp.route('/state', methods=['GET'])
     def get_telemetry_state():
         """Get the current state of the go-kart"""
+        # Serve the body the update task fetched this tick instead of asking the collector again
+        cached_at, body = _cached_state
+        if body is not None and time.monotonic() - cached_at < STATE_CACHE_TTL:
+            return current_app.response_class(body, mimetype='application/json')
+
         try:
             # Fetch the current state from the collector API
-            response = requests.get(f"{COLLECTOR_API_URL}/api/state/current", timeout=1.0)
+            response = collector_session.get(f"{COLLECTOR_API_URL}/api/state/current", timeout=1.0)
             response.raise_for_status()
-            return jsonify(response.json())
+            # The collector already returns JSON; pass its body through without re-encoding
+            return fast_json.response(response.content, response.status_code)
         except Exception as e:
             logger.error(f"Error getting state from collector: {e}")
             # Fall back to local state if collector is unavailable
             try:
                 state = telemetry_store.get_current_state()
-                return jsonify(state)
+                return fast_json.jsonify(state)
             except Exception as e2:
                 logger.error(f"Error getting local state: {e2}")
                 return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -48,49 +125,62 @@ def register_telemetry_routes(app, telemetry_store: TelemetryStore, can_interfac
             offset = request.args.get('offset', 0, type=int)
             
             # Fetch history from the collector API
-            response = requests.get(
+            response = collector_session.get(
                 f"{COLLECTOR_API_URL}/api/state/history", 
                 params={'limit': limit, 'offset': offset},
                 timeout=1.0
             )
             response.raise_for_status()
-            return jsonify(response.json())
+            return fast_json.response(response.content, response.status_code)
         except Exception as e:
             logger.error(f"Error getting history from collector: {e}")
             # Fall back to local history as last resort
             try:
                 history = telemetry_store.get_history(limit=limit)
-                return jsonify(history)
+                return fast_json.jsonify(history)
             except Exception as e2:
                 logger.error(f"Error getting local history: {e2}")
                 return jsonify({'status': 'error', 'message': str(e)}), 500
             
+    def fetch_status_body() -> bytes:
+        """Build the status JSON body from the collector, or from local state if it is unavailable"""
+        # Try to get status from collector first
+        try:
+            response = collector_session.get(f"{COLLECTOR_API_URL}/api/status", timeout=0.5)
+            response.raise_for_status()
+            return response.content
+        except:
+            # Fall back to local status if collector unavailable
+            state = telemetry_store.get_current_state()
+            connected = state.get('connected', False)
+            last_update = state.get('last_update', 0)
+            current_time = time.time()
+            
+            status = {
+                'connected': connected,
+                'last_update': last_update,
+                'last_update_formatted': format_last_update(last_update),
+                'uptime': current_time - last_update if last_update > 0 else 0,
+                'interface_type': 'CAN' if can_interface.has_can_hardware else 'SIM',
+                'collector_connected': False
+            }
+            
+            return fast_json.dumps(status)
+
     @telemetry_bp.route('/status', methods=['GET'])
     def get_telemetry_status():
         """Get telemetry connection status"""
+        global _cached_status
         try:
-            # Try to get status from collector first
-            try:
-                response = requests.get(f"{COLLECTOR_API_URL}/api/status", timeout=0.5)
-                response.raise_for_status()
-                return jsonify(response.json())
-            except:
-                # Fall back to local status if collector unavailable
-                state = telemetry_store.get_current_state()
-                connected = state.get('connected', False)
-                last_update = state.get('last_update', 0)
-                current_time = time.time()
-                
-                status = {
-                    'connected': connected,
-                    'last_update': last_update,
-                    'last_update_formatted': datetime.fromtimestamp(last_update).strftime('%Y-%m-%d %H:%M:%S') if last_update else 'Never',
-                    'uptime': current_time - last_update if last_update > 0 else 0,
-                    'interface_type': 'CAN' if can_interface.has_can_hardware else 'SIM',
-                    'collector_connected': False
-                }
-                
-                return jsonify(status)
+            expires, body = _cached_status
+            if body is None or time.monotonic() >= expires:
+                with _status_lock:
+                    # Another request may have refreshed it while we waited for the lock
+                    expires, body = _cached_status
+                    if body is None or time.monotonic() >= expires:
+                        body = fetch_status_body()
+                        _cached_status = (time.monotonic() + STATUS_CACHE_TTL, body)
+            return fast_json.response(body)
         except Exception as e:
             logger.error(f"Error getting telemetry status: {e}")
             return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -99,25 +189,9 @@ def register_telemetry_routes(app, telemetry_store: TelemetryStore, can_interfac
     def get_telemetry_stream():
         """Display a real-time telemetry stream"""
         try:
-            # Fetch sample data from collector to determine fields
-            try:
-                response = requests.get(f"{COLLECTOR_API_URL}/api/state/history?limit=1", timeout=0.5)
-                response.raise_for_status()
-                history_data = response.json()
-                if history_data and len(history_data) > 0:
-                    state_fields = list(history_data[0].keys())
-                else:
-                    # Fallback fields if no data available
-                    state_fields = ['timestamp', 'message_type', 'component_type', 
-                                   'component_id', 'command_id', 'value_type', 'value']
-            except:
-                # Fallback if collector unavailable
-                state_fields = ['timestamp', 'message_type', 'component_type', 
-                               'component_id', 'command_id', 'value_type', 'value']
-            
-            return render_template('telemetry_stream.html', 
-                                  state_fields=state_fields,
-                                  collector_url=COLLECTOR_API_URL)
+            if time.monotonic() >= stream_ctx_expires[0]:
+                refresh_state_fields()
+            return stream_template.render(**stream_ctx)
         except Exception as e:
             logger.error(f"Error rendering telemetry stream: {e}")
             return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -2,7 +2,10 @@
 Go-Kart Dashboard Server - Main entry point
 """
 
-import threading
+# Must run before any other import; see api/endpoints.py
+import eventlet
+eventlet.monkey_patch()
+
 import logging
 import os
 import sys
@@ -12,7 +15,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from api.endpoints import app, socketio, send_updates
+from api.endpoints import app, socketio, start_update_task
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -21,10 +24,8 @@ logger = logging.getLogger(__name__)
 if __name__ == "__main__":
     logger.info("Starting Go-Kart Dashboard Server")
     
-    # Start background thread for updates
-    thread = threading.Thread(target=send_updates, daemon=True)
-    thread.start()
-    logger.info("Started state update thread")
+    # Start background task for updates
+    start_update_task()
     
     try:
         # Start the web server
@@ -0,0 +1,79 @@
+"""
+Flask/Socket.IO application factory for the Go-Kart Dashboard
+"""
+
+import os
+import hashlib
+
+from flask import Flask, request
+from flask_socketio import SocketIO
+from flask_cors import CORS
+
+from api import fast_json
+from api.telemetry import register_telemetry_routes
+from api.commands import register_command_routes
+from api.direct_commands import register_direct_command_routes
+from api.protocol import register_protocol_routes
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Static URLs from static_url() carry a content hash and change with the file,
+# so browsers can keep them (and their compiled scripts) for a year
+VERSIONED_STATIC_MAX_AGE = 365 * 24 * 3600
+
+
+class DashboardFlask(Flask):
+    """Flask app that serves content-versioned static URLs with a long cache lifetime."""
+
+    def get_send_file_max_age(self, filename):
+        if request.args.get('v'):
+            return VERSIONED_STATIC_MAX_AGE
+        return super().get_send_file_max_age(filename)
+
+
+def create_app(telemetry_store, can_interface, protocol_registry):
+    """Create the dashboard app and its Socket.IO server with all API routes registered.
+
+    Returns:
+        tuple: (app, socketio)
+    """
+    app = DashboardFlask(__name__,
+                         static_folder=os.path.join(SERVER_DIR, 'static'),
+                         template_folder=os.path.join(SERVER_DIR, 'templates'))
+
+    # Compact, unsorted jsonify output (Flask < 2.2 config keys, then the JSON provider)
+    app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+    app.config['JSON_SORT_KEYS'] = False
+    if hasattr(app, 'json'):
+        app.json.compact = True
+        app.json.sort_keys = False
+
+    # Templates don't change while the server runs; skip per-render mtime checks
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+
+    # Content hash per static file, read once; built without url_for so pages can
+    # also be rendered outside a request
+    static_versions = {}
+
+    def static_url(filename):
+        """Return the URL of a static file with its content hash as the version."""
+        version = static_versions.get(filename)
+        if version is None:
+            with open(os.path.join(app.static_folder, filename), 'rb') as f:
+                version = static_versions[filename] = hashlib.sha1(f.read()).hexdigest()[:12]
+        return f"{app.static_url_path}/{filename}?v={version}"
+
+    app.jinja_env.globals['static_url'] = static_url
+
+    CORS(app)
+    # Socket.IO packets are encoded with orjson when available (see fast_json)
+    socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet',
+                        json=fast_json.SocketIOJSON)
+
+    register_telemetry_routes(app, telemetry_store, can_interface)
+    register_command_routes(app, can_interface)
+    register_direct_command_routes(app, can_interface)
+    register_protocol_routes(app, protocol_registry)
+
+    return app, socketio
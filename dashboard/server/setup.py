@@ -146,8 +146,8 @@ setup(
         'eventlet',
         'python-can',
         'protobuf',
-        'python-engineio',
-        'python-socketio',
+        'python-engineio>=4.3,<5',  # api/endpoints.py reads per-client send queues
+        'python-socketio>=5.4,<6',
         'cffi',
     ],
     python_requires='>=3.6',
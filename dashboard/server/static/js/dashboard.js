@@ -1,51 +1,74 @@
 // Connect to WebSocket server
 const socket = io();
 
+// Every element with an id, collected in one pass over the document
+const elements = Object.fromEntries(
+    Array.from(document.querySelectorAll('[id]'), element => [element.id, element])
+);
+
 // DOM elements
-const speedValue = document.getElementById('speed-value');
-const throttleValue = document.getElementById('throttle-value');
-const batteryValue = document.getElementById('battery-value');
-const tempValue = document.getElementById('temp-value');
-const brakeValue = document.getElementById('brake-value');
-const steeringValue = document.getElementById('steering-value');
-
-const speedControl = document.getElementById('speed-control');
-const steeringControl = document.getElementById('steering-control');
-const brakeControl = document.getElementById('brake-control');
-const speedDisplay = document.getElementById('speed-display');
-const steeringDisplay = document.getElementById('steering-display');
-const brakeDisplay = document.getElementById('brake-display');
-
-const emergencyStopBtn = document.getElementById('emergency-stop');
-const sendCommandsBtn = document.getElementById('send-commands');
+const speedValue = elements['speed-value'];
+const throttleValue = elements['throttle-value'];
+const batteryValue = elements['battery-value'];
+const tempValue = elements['temp-value'];
+const brakeValue = elements['brake-value'];
+const steeringValue = elements['steering-value'];
+
+const speedControl = elements['speed-control'];
+const steeringControl = elements['steering-control'];
+const brakeControl = elements['brake-control'];
+const speedDisplay = elements['speed-display'];
+const steeringDisplay = elements['steering-display'];
+const brakeDisplay = elements['brake-display'];
+
+const emergencyStopBtn = elements['emergency-stop'];
+const sendCommandsBtn = elements['send-commands'];
 
 // Camera elements
-const cameraPanel = document.getElementById('camera-panel');
-const cameraFeed = document.getElementById('camera-feed');
-const cameraStatus = document.getElementById('camera-status');
-const cameraToggle = document.getElementById('camera-toggle');
-const cameraSnapshot = document.getElementById('camera-snapshot');
+const cameraPanel = elements['camera-panel'];
+const cameraFeed = elements['camera-feed'];
+const cameraStatus = elements['camera-status'];
+const cameraToggle = elements['camera-toggle'];
+const cameraSnapshot = elements['camera-snapshot'];
 let cameraActive = true;
 
 // Get simulation mode toggle and status
-const simulationToggle = document.getElementById('simulation-toggle');
-const simulationStatus = document.getElementById('simulation-status');
+const simulationToggle = elements['simulation-toggle'];
+const simulationStatus = elements['simulation-status'];
 
 // Hide simulation control
 simulationToggle.parentElement.parentElement.parentElement.style.display = 'none';
 
-// Update displays when controls change
-speedControl.addEventListener('input', () => {
+// Run fn at most once per animation frame, with the arguments of the latest call
+function rafThrottle(fn) {
+    let pending = false;
+    let lastArgs;
+    return (...args) => {
+        lastArgs = args;
+        if (pending) return;
+        pending = true;
+        requestAnimationFrame(() => {
+            pending = false;
+            fn(...lastArgs);
+        });
+    };
+}
+
+// Update displays when controls change; a drag fires input far faster than the screen refreshes
+speedControl.addEventListener('input', rafThrottle(() => {
     speedDisplay.textContent = speedControl.value;
-});
+}));
 
-steeringControl.addEventListener('input', () => {
+steeringControl.addEventListener('input', rafThrottle(() => {
     steeringDisplay.textContent = steeringControl.value;
-});
+}));
 
-brakeControl.addEventListener('input', () => {
+brakeControl.addEventListener('input', rafThrottle(() => {
     brakeDisplay.textContent = brakeControl.value;
-});
+}));
+
+// Shared by every command request
+const JSON_HEADERS = { 'Content-Type': 'application/json' };
 
 // Helper function for sending commands
 function sendCommand(componentType, componentName, commandName, value) {
@@ -57,9 +80,7 @@ function sendCommand(componentType, componentName, commandName, value) {
     
     return fetch('/api/command', {
         method: 'POST',
-        headers: {
-            'Content-Type': 'application/json',
-        },
+        headers: JSON_HEADERS,
         body: JSON.stringify({
             component_type: componentType,
             component_name: componentName,
@@ -104,12 +125,14 @@ sendCommandsBtn.addEventListener('click', () => {
     sendCommand('MOTORS', 'MOTOR_LEFT_REAR', 'BRAKE', parseInt(brakeControl.value) > 0 ? 1 : 0);
 });
 
+// Time axis labels; one formatter shared by every tick instead of one per toLocaleTimeString call
+const tickTimeFormat = new Intl.DateTimeFormat([], { hour: '2-digit', minute: '2-digit', second: '2-digit' });
+
 // Setup Chart.js
-const ctx = document.getElementById('historyChart').getContext('2d');
+const ctx = elements['historyChart'].getContext('2d');
 const chart = new Chart(ctx, {
     type: 'line',
     data: {
-        labels: [],
         datasets: [
             {
                 label: 'Speed (km/h)',
@@ -140,6 +163,10 @@ const chart = new Chart(ctx, {
         animation: {
             duration: 0 // Disable animations for better performance
         },
+        // Points are already {x, y} objects (required for decimation), sorted by x with
+        // unique values, so Chart.js can skip both its parse and its sort/uniqueness checks
+        parsing: false,
+        normalized: true,
         elements: {
             line: {
                 tension: 0.2 // Slight curve for better visualization
@@ -147,6 +174,7 @@ const chart = new Chart(ctx, {
         },
         scales: {
             x: {
+                type: 'linear', // x is the sample time in ms
                 display: true,
                 title: {
                     display: true,
@@ -154,7 +182,8 @@ const chart = new Chart(ctx, {
                 },
                 ticks: {
                     maxTicksLimit: 10, // Limit X-axis labels for readability
-                    autoSkip: true
+                    autoSkip: true,
+                    callback: value => tickTimeFormat.format(value)
                 }
             },
             y: {
@@ -169,19 +198,121 @@ const chart = new Chart(ctx, {
         plugins: {
             legend: {
                 position: 'top'
+            },
+            // Draw each line from a downsampled window rather than every stored point
+            decimation: {
+                enabled: true,
+                algorithm: 'lttb',
+                samples: 150,
+                threshold: 150 // Otherwise only kicks in above 4 points per pixel of width
             }
         }
     }
 });
 
-// Data structure to track timestamps and values
-const chartData = {
-    timestamps: [], // Array of unique timestamps
-    // Object to hold values for each metric, indexed by timestamp
-    speed: {},      // motor_main/rpm
-    motor_temp: {}, // motor_main/temperature
-    battery_voltage: {} // battery/voltage
+// Chart history: a fixed-size ring per metric, so a new sample overwrites the oldest
+// in place instead of shifting arrays on every update
+const CHART_CAPACITY = 600;
+const CHART_REDRAW_INTERVAL_MS = 100; // Redraw at most ~10 times per second
+
+function createRing() {
+    return {
+        times: new Float64Array(CHART_CAPACITY), // ms since epoch
+        values: new Float32Array(CHART_CAPACITY),
+        head: 0, // Next slot to write
+        size: 0
+    };
+}
+
+// Keyed by metric, in chart dataset order
+const chartRings = {
+    speed: createRing(),
+    motor_temp: createRing(),
+    battery_voltage: createRing()
 };
+const chartMetrics = Object.keys(chartRings);
+
+function pushSample(ring, timeMs, value) {
+    // The linear x scale and decimation expect strictly ascending x; drop late or repeated samples
+    if (ring.size > 0 && timeMs <= ring.times[(ring.head + CHART_CAPACITY - 1) % CHART_CAPACITY]) {
+        return;
+    }
+    ring.times[ring.head] = timeMs;
+    ring.values[ring.head] = value;
+    ring.head = (ring.head + 1) % CHART_CAPACITY;
+    if (ring.size < CHART_CAPACITY) ring.size++;
+}
+
+// Call fn(timeMs, value) for each sample, oldest first
+function forEachSample(ring, fn) {
+    let idx = (ring.head + CHART_CAPACITY - ring.size) % CHART_CAPACITY;
+    for (let i = 0; i < ring.size; i++) {
+        fn(ring.times[idx], ring.values[idx]);
+        idx = (idx + 1) % CHART_CAPACITY;
+    }
+}
+
+// Per dataset: {x, y} objects allocated once, and the array handed to Chart.js.
+// Redraws refill both in place, so steady-state updates allocate nothing
+const chartPoints = chartMetrics.map(() => ({
+    pool: Array.from({ length: CHART_CAPACITY }, () => ({ x: 0, y: 0 })),
+    data: []
+}));
+
+// Copy a ring into its dataset's points, oldest to newest
+function fillPoints(ring, points) {
+    const { pool, data } = points;
+    data.length = ring.size;
+    let i = 0;
+    forEachSample(ring, (timeMs, value) => {
+        const point = pool[i];
+        point.x = timeMs;
+        point.y = value;
+        data[i++] = point;
+    });
+    return data;
+}
+
+// Coalesce any number of updates into one chart redraw per animation frame
+let chartDirty = false;
+let redrawScheduled = false;
+let lastRedraw = 0;
+
+function scheduleRedraw() {
+    chartDirty = true;
+    // While the tab is hidden samples still go into the rings; the redraw waits until it's shown
+    if (!redrawScheduled && !document.hidden) {
+        redrawScheduled = true;
+        requestAnimationFrame(redrawChart);
+    }
+}
+
+function redrawChart(now) {
+    if (document.hidden) {
+        redrawScheduled = false;
+        return;
+    }
+    if (now - lastRedraw < CHART_REDRAW_INTERVAL_MS) {
+        requestAnimationFrame(redrawChart);
+        return;
+    }
+    redrawScheduled = false;
+    if (!chartDirty) return;
+    chartDirty = false;
+    lastRedraw = now;
+
+    chartMetrics.forEach((metric, i) => {
+        chart.data.datasets[i].data = fillPoints(chartRings[metric], chartPoints[i]);
+    });
+    chart.update('none');
+}
+
+// Catch up with everything received while hidden in a single redraw
+document.addEventListener('visibilitychange', () => {
+    if (!document.hidden && chartDirty) {
+        scheduleRedraw();
+    }
+});
 
 // Mapping of component/command to chart properties
 const dataMapping = {
@@ -196,50 +327,7 @@ const dataMapping = {
     }
 };
 
-// Helper function to find or add timestamp in sorted array
-function findOrAddTimestamp(timestamp) {
-    const timeStr = new Date(timestamp * 1000).toLocaleTimeString();
-    const index = chartData.timestamps.indexOf(timeStr);
-    
-    if (index !== -1) {
-        return { index, timeStr };
-    }
-    
-    // Add new timestamp in chronological order
-    chartData.timestamps.push(timeStr);
-    
-    // Sort timestamps (ensures they remain in chronological order)
-    chartData.timestamps.sort((a, b) => {
-        const dateA = new Date(`1970-01-01 ${a}`);
-        const dateB = new Date(`1970-01-01 ${b}`);
-        return dateA - dateB;
-    });
-    
-    return { 
-        index: chartData.timestamps.indexOf(timeStr), 
-        timeStr 
-    };
-}
-
-// Helper function to update chart with current data
-function updateChart() {
-    // Reset chart data
-    chart.data.labels = [...chartData.timestamps];
-    
-    // Update each dataset
-    const speedData = chartData.timestamps.map(ts => chartData.speed[ts] || null);
-    const tempData = chartData.timestamps.map(ts => chartData.motor_temp[ts] || null);
-    const batteryData = chartData.timestamps.map(ts => chartData.battery_voltage[ts] || null);
-    
-    chart.data.datasets[0].data = speedData;
-    chart.data.datasets[1].data = tempData;
-    chart.data.datasets[2].data = batteryData;
-    
-    // Force complete redraw
-    chart.update('none');
-}
-
-// Helper function to add or update a data point based on component_type, component_id, and command_id
+// Helper function to add a data point based on component_type, component_id, and command_id
 function updateDataPointFromState(state) {
     // Check if this state update is for a telemetry value we chart
     const componentMapping = dataMapping[state.component_type];
@@ -254,114 +342,174 @@ function updateDataPointFromState(state) {
     // Convert string value to appropriate numeric type
     const value = valueMapping.conversion(state.value);
     
-    // Find or add timestamp slot
-    const { timeStr } = findOrAddTimestamp(state.timestamp);
-    
-    // Update the specific metric
-    chartData[valueMapping.metric][timeStr] = value;
-    
-    // Enforce data point limit (keep last 600 timestamps)
-    if (chartData.timestamps.length > 600) {
-        const removed = chartData.timestamps.shift();
-        delete chartData.speed[removed];
-        delete chartData.motor_temp[removed];
-        delete chartData.battery_voltage[removed];
-    }
-    
+    pushSample(chartRings[valueMapping.metric], state.timestamp * 1000, value);
     return true;
 }
 
-// Fetch historical data on load
-fetch('/api/telemetry/history')
-    .then(response => response.json())
-    .then(data => {
-        if (data.length === 0) return;
-        
-        // Process each data point
-        let dataUpdated = false;
-        data.forEach(item => {
-            if (updateDataPointFromState(item)) {
-                dataUpdated = true;
-            }
-        });
-        
-        // Update chart if we processed any data
-        if (dataUpdated) {
-            updateChart();
+// History is streamed over the socket: history_chunk events carry rows newest first
+// and history_end marks the last one. Chunks are kept as received until then.
+let historyChunks = [];
+
+socket.on('connect', () => {
+    historyChunks = [];
+    socket.emit('history_request');
+});
+
+socket.on('history_chunk', (rows) => {
+    historyChunks.push(rows);
+});
+
+socket.on('history_end', () => {
+    const chunks = historyChunks;
+    historyChunks = [];
+    if (chunks.length === 0) return;
+
+    // Live updates may already be in the rings, so replay history oldest first
+    // into fresh rings and then re-add the live samples after it
+    const live = chartMetrics.map(metric => chartRings[metric]);
+    chartMetrics.forEach(metric => { chartRings[metric] = createRing(); });
+
+    let rowCount = 0;
+    for (let c = chunks.length - 1; c >= 0; c--) {
+        const rows = chunks[c];
+        for (let r = rows.length - 1; r >= 0; r--) {
+            updateDataPointFromState(rows[r]);
         }
-        
-        console.log(`Loaded ${data.length} historical data points`);
-    })
-    .catch(error => {
-        console.error('Error fetching historical data:', error);
+        rowCount += rows.length;
+    }
+    chartMetrics.forEach((metric, i) => {
+        forEachSample(live[i], (timeMs, value) => pushSample(chartRings[metric], timeMs, value));
     });
 
-// Listen for real-time updates
-socket.on('state_update', (state) => {
-    // Update data point if it's a chartable metric
-    let chartUpdated = updateDataPointFromState(state);
-    
-    // Update dashboard metrics based on the component_type, component_id, and command_id
-    if (state.component_type === 'sensors') {
-        if (state.component_id === 'motor_main') {
-            if (state.command_id === 'rpm') {
-                speedValue.textContent = (parseInt(state.value) / 100).toFixed(2); // Convert RPM to speed
-            } else if (state.command_id === 'temperature') {
-                tempValue.textContent = parseFloat(state.value).toFixed(2);
-            } else if (state.command_id === 'throttle') {
-                throttleValue.textContent = parseInt(state.value);
-            }
-        } else if (state.component_id === 'battery') {
-            if (state.command_id === 'voltage') {
-                batteryValue.textContent = parseFloat(state.value).toFixed(2);
-            }
-        } else if (state.component_id === 'brake') {
-            if (state.command_id === 'pressure') {
-                brakeValue.textContent = parseFloat(state.value).toFixed(2);
-            }
-        } else if (state.component_id === 'steering') {
-            if (state.command_id === 'angle') {
-                steeringValue.textContent = parseFloat(state.value).toFixed(2);
-            }
+    scheduleRedraw();
+    console.log(`Loaded ${rowCount} historical data points`);
+});
+
+// Last text set on each metric element, so unchanged values don't touch the DOM
+const lastText = {};
+
+// Text waiting to be written on the next animation frame; a batch of samples updating the
+// same metric several times writes the element only once, with the latest value
+const pendingText = new Map();
+let textFlushScheduled = false;
+
+function setText(element, text) {
+    if (lastText[element.id] === text) return;
+    lastText[element.id] = text;
+    pendingText.set(element, text);
+    if (!textFlushScheduled) {
+        textFlushScheduled = true;
+        requestAnimationFrame(flushText);
+    }
+}
+
+function flushText() {
+    textFlushScheduled = false;
+    pendingText.forEach((text, element) => {
+        element.textContent = text;
+    });
+    pendingText.clear();
+}
+
+// Index of the active button per light button group; switching only touches the old and new button
+const activeButtonIndex = { mode: 0, signal: 0, location: 0 };
+
+function setActiveButton(group, buttons, index) {
+    const previous = activeButtonIndex[group];
+    if (previous === index) return;
+    if (buttons[previous]) buttons[previous].classList.remove('active');
+    if (buttons[index]) buttons[index].classList.add('active');
+    activeButtonIndex[group] = index;
+}
+
+function setToggle(toggle, status, isOn) {
+    if (toggle.checked !== isOn) toggle.checked = isOn;
+    setText(status, isOn ? 'On' : 'Off');
+}
+
+// Light status mode values to mode button indices; unknown modes show Off
+const LIGHT_MODE_BUTTON_INDEX = { 0: 0, 1: 1, 2: 2, 8: 3 };
+
+function lightHandlers(location) {
+    // Only handle light updates for the current active location
+    const ifActive = fn => value => {
+        if (getLocation() === location) fn(value);
+    };
+    return {
+        'mode': ifActive(value => setActiveButton('mode', lightModeButtons, LIGHT_MODE_BUTTON_INDEX[parseInt(value)] || 0)),
+        'signal': ifActive(value => setActiveButton('signal', signalButtons, parseInt(value))),
+        'brake': ifActive(value => setToggle(brakeToggle, brakeStatus, parseInt(value) === 1))
+    };
+}
+
+// Dashboard metric updates by component_type, component_id and command_id, looked up
+// like dataMapping instead of walking a chain of comparisons for every state
+const metricHandlers = {
+    'sensors': {
+        'motor_main': {
+            'rpm': value => setText(speedValue, (parseInt(value) / 100).toFixed(2)), // Convert RPM to speed
+            'temperature': value => setText(tempValue, parseFloat(value).toFixed(2)),
+            'throttle': value => setText(throttleValue, String(parseInt(value)))
+        },
+        'battery': {
+            'voltage': value => setText(batteryValue, parseFloat(value).toFixed(2))
+        },
+        'brake': {
+            'pressure': value => setText(brakeValue, parseFloat(value).toFixed(2))
+        },
+        'steering': {
+            'angle': value => setText(steeringValue, parseFloat(value).toFixed(2))
         }
-    } else if (state.component_type === 'lights') {
-        const isRear = state.component_id === 'rear';
-        const isFront = state.component_id === 'front';
-        
-        // Only handle light updates for the current active location
-        const activeLocation = getLocation();
-        if ((isFront && activeLocation === 'FRONT') || (isRear && activeLocation === 'REAR')) {
-            if (state.command_id === 'mode') {
-                const modeValue = parseInt(state.value);
-                // Map mode values to button indices
-                const buttonIndex = modeValue === 0 ? 0 : // Off
-                                   modeValue === 1 ? 1 : // Low
-                                   modeValue === 2 ? 2 : // High
-                                   modeValue === 8 ? 3 : 0; // Hazard
-                                   
-                lightModeButtons.forEach((btn, idx) => {
-                    btn.classList.toggle('active', idx === buttonIndex);
-                });
-            } else if (state.command_id === 'signal') {
-                const signalValue = parseInt(state.value);
-                signalButtons.forEach((btn, idx) => {
-                    btn.classList.toggle('active', idx === signalValue);
-                });
-            } else if (state.command_id === 'brake') {
-                const brakeValue = parseInt(state.value) === 1;
-                brakeToggle.checked = brakeValue;
-                brakeStatus.textContent = brakeValue ? 'On' : 'Off';
-            }
+    },
+    'lights': {
+        'front': lightHandlers('FRONT'),
+        'rear': lightHandlers('REAR')
+    },
+    'controls': {
+        'diagnostic': {
+            'mode': value => setToggle(testToggle, testStatus, parseInt(value) === 1)
         }
-    } else if (state.component_type === 'controls' && state.component_id === 'diagnostic' && state.command_id === 'mode') {
-        const testValue = parseInt(state.value) === 1;
-        testToggle.checked = testValue;
-        testStatus.textContent = testValue ? 'On' : 'Off';
     }
-    
-    // Update chart if necessary
+};
+
+// Apply one state sample to the metrics, light controls and chart rings.
+// Returns true if the sample was charted.
+function updateMetrics(state) {
+    // Update data point if it's a chartable metric
+    const chartUpdated = updateDataPointFromState(state);
+
+    // Update dashboard metrics based on the component_type, component_id, and command_id
+    const componentHandlers = metricHandlers[state.component_type];
+    const commandHandlers = componentHandlers && componentHandlers[state.component_id];
+    const handler = commandHandlers && commandHandlers[state.command_id];
+    if (handler) {
+        handler(state.value);
+    }
+
+    return chartUpdated;
+}
+
+// Latest full state; batch entries may hold only the fields that changed and are merged into it
+const currentState = {};
+
+// Listen for real-time updates
+socket.on('state_update', (state) => {
+    Object.assign(currentState, state);
+    // Redraw on the next animation frame; updates within the same frame share it
+    if (updateMetrics(currentState)) {
+        scheduleRedraw();
+    }
+});
+
+// Batched updates: apply every sample in order, then redraw once
+socket.on('state_batch', (states) => {
+    let chartUpdated = false;
+    for (const delta of states) {
+        Object.assign(currentState, delta);
+        if (updateMetrics(currentState)) chartUpdated = true;
+    }
     if (chartUpdated) {
-        updateChart();
+        scheduleRedraw();
     }
 });
 
@@ -420,126 +568,110 @@ cameraSnapshot.addEventListener('click', () => {
 const lightModeButtons = document.querySelectorAll('.light-mode-btn');
 const signalButtons = document.querySelectorAll('.signal-btn');
 const locationButtons = document.querySelectorAll('.location-btn');
-const brakeToggle = document.getElementById('brake-toggle');
-const brakeStatus = document.getElementById('brake-status');
-const testToggle = document.getElementById('test-toggle');
-const testStatus = document.getElementById('test-status');
+const brakeToggle = elements['brake-toggle'];
+const brakeStatus = elements['brake-status'];
+const testToggle = elements['test-toggle'];
+const testStatus = elements['test-status'];
 
 function getLocation() {
-    // findIndex is not a function on the locationButtons object
-    const index = Array.from(locationButtons).findIndex(btn => btn.classList.contains('active'));
     // todo: make more generic for more locations to be added in the future
-    return index === 0 ? 'FRONT' : 'REAR';
+    return activeButtonIndex.location === 0 ? 'FRONT' : 'REAR';
 }
 
-// Light mode control
-lightModeButtons.forEach((button, index) => {
-    button.addEventListener('click', () => {
-        lightModeButtons.forEach(btn => btn.classList.remove('active'));
-        button.classList.add('active');
-
-        const mode = button.textContent.toLowerCase();
-        const modeValue = mode === 'off'
-            ? 0
-            : mode === 'low'
-                ? 1
-                : mode === 'high'
-                    ? 4
-                    : mode === 'hazard' ? 8 : 0;
+// Encoded request bodies by target and value; light controls only have a handful of
+// values each, so every body is built once and reused on later clicks
+const lightCommandBodies = new Map();
 
-        fetch('/api/command', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                component_type: 'LIGHTS',
-                component_name: getLocation(),
-                command_name: 'MODE',
-                direct_value: modeValue
-            }),
+function lightCommandBody(target, componentType, componentName, commandName, value) {
+    const key = `${target}=${value}`;
+    let body = lightCommandBodies.get(key);
+    if (body === undefined) {
+        body = JSON.stringify({
+            component_type: componentType,
+            component_name: componentName,
+            command_name: commandName,
+            direct_value: value
         });
-    });
-});
+        lightCommandBodies.set(key, body);
+    }
+    return body;
+}
+
+// Light control command bodies waiting for the next animation frame, keyed by target,
+// so repeated clicks within a frame send only the latest value for each control
+const pendingLightCommands = new Map();
+let lightFlushScheduled = false;
+
+function queueLightCommand(componentType, componentName, commandName, value) {
+    const target = `${componentType}.${componentName}.${commandName}`;
+    pendingLightCommands.set(target, lightCommandBody(target, componentType, componentName, commandName, value));
+    if (!lightFlushScheduled) {
+        lightFlushScheduled = true;
+        requestAnimationFrame(flushLightCommands);
+    }
+}
 
-// Turn signal control
-signalButtons.forEach((button, index) => {
-    button.addEventListener('click', () => {
-        signalButtons.forEach(btn => btn.classList.remove('active'));
-        button.classList.add('active');
-        
+function flushLightCommands() {
+    lightFlushScheduled = false;
+    for (const [target, body] of pendingLightCommands) {
+        // Fire-and-forget: nothing waits on the response, and keepalive lets the
+        // request finish even if the page is closing
         fetch('/api/command', {
             method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                component_type: 'LIGHTS',
-                component_name: getLocation(),
-                command_name: 'SIGNAL',
-                direct_value: index
-            }),
+            headers: JSON_HEADERS,
+            body,
+            keepalive: true
+        })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`Server returned ${response.status}: ${response.statusText}`);
+            }
+        })
+        .catch(error => {
+            console.error(`Error sending ${target} command:`, error);
         });
-    });
+    }
+    pendingLightCommands.clear();
+}
+
+// Light mode values by button position: Off, Low, High, Hazard
+const LIGHT_MODE_VALUES = [0, 1, 4, 8];
+
+// One delegated listener per button group; each button carries its position in data-index
+function handleButtonGroupClick(event) {
+    const button = event.target.closest('[data-index]');
+    if (!button) return;
+    const index = parseInt(button.dataset.index);
+
+    if (button.matches('.light-mode-btn')) {
+        setActiveButton('mode', lightModeButtons, index);
+        queueLightCommand('LIGHTS', getLocation(), 'MODE', LIGHT_MODE_VALUES[index]);
+    } else if (button.matches('.signal-btn')) {
+        setActiveButton('signal', signalButtons, index);
+        queueLightCommand('LIGHTS', getLocation(), 'SIGNAL', index);
+    } else if (button.matches('.location-btn')) {
+        setActiveButton('location', locationButtons, index);
+        // 0 for FRONT, 1 for REAR
+        queueLightCommand('LIGHTS', getLocation(), 'LOCATION', index === 0 ? 0 : 1);
+    }
+}
+
+document.querySelectorAll('.button-group').forEach(group => {
+    group.addEventListener('click', handleButtonGroupClick);
 });
 
 // Brake lights control
 brakeToggle.addEventListener('change', () => {
     const isOn = brakeToggle.checked;
-    brakeStatus.textContent = isOn ? 'On' : 'Off';
+    setText(brakeStatus, isOn ? 'On' : 'Off');
 
-    // get location from location buttons
-    
-    fetch('/api/command', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                component_type: 'LIGHTS',
-                component_name: getLocation(),
-                command_name: 'BRAKE',
-                direct_value: isOn ? 1 : 0
-            }),
-        });
+    queueLightCommand('LIGHTS', getLocation(), 'BRAKE', isOn ? 1 : 0);
 });
 
 // Test mode control
 testToggle.addEventListener('change', () => {
     const isOn = testToggle.checked;
-    testStatus.textContent = isOn ? 'On' : 'Off';
-    
-    fetch('/api/command', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                component_type: 'CONTROLS',
-                component_name: 'DIAGNOSTIC',
-                command_name: 'MODE',
-                direct_value: isOn ? 1 : 0
-            }),
-        });
-});
+    setText(testStatus, isOn ? 'On' : 'Off');
 
-// Location control
-locationButtons.forEach((button, index) => {
-    button.addEventListener('click', () => {
-        locationButtons.forEach(btn => btn.classList.remove('active'));
-        button.classList.add('active');
-        
-        fetch('/api/command', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                component_type: 'LIGHTS',
-                component_name: getLocation(),
-                command_name: 'LOCATION',
-                direct_value: index === 0 ? 0 : 1 // 0 for FRONT, 1 for REAR
-            }),
-        });
-    });
-}); 
\ No newline at end of file
+    queueLightCommand('CONTROLS', 'DIAGNOSTIC', 'MODE', isOn ? 1 : 0);
+});
@@ -0,0 +1,77 @@
+"""
+Tests for the collector's long-polled /api/state/current, which the dashboard update task waits on
+"""
+import importlib.util
+import os
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import json
+
+# Project root for the shared modules, as in app.py
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from shared.lib.python.telemetry.state import GoKartState
+from shared.lib.python.telemetry.store import TelemetryStore
+
+# The collector's module is also called "api"; load it under another name so it doesn't
+# shadow the dashboard's api package
+_spec = importlib.util.spec_from_file_location(
+    'collector_api', os.path.join(PROJECT_ROOT, 'telemetry', 'collector', 'api.py'))
+collector_api = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(collector_api)
+
+@pytest.fixture
+def store():
+    store = TelemetryStore(protocol=MagicMock())
+    # Only the timestamp is set, so the readable conversion never consults the protocol
+    store.update_state(GoKartState(timestamp=100.0))
+    return store
+
+@pytest.fixture
+def client(store):
+    # Capture the app instead of starting its HTTP server thread
+    with patch.object(collector_api, 'threading') as threading_mock:
+        collector_api.create_api_server_manager(store, 'vehicle', '127.0.0.1', 0)
+    app = threading_mock.Thread.call_args.kwargs['args'][0]
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+def test_current_state_without_since_returns_at_once(client):
+    """Test that a plain request is answered without waiting"""
+    start = time.monotonic()
+    response = client.get('/api/state/current?wait=5')
+    assert time.monotonic() - start < 0.5
+    assert json.loads(response.data)['timestamp'] == 100.0
+
+def test_current_state_waits_until_timeout_when_unchanged(client):
+    """Test that a request for the state the caller already has waits out its timeout"""
+    start = time.monotonic()
+    response = client.get('/api/state/current?since=100.0&wait=0.2')
+    assert time.monotonic() - start >= 0.2
+    assert json.loads(response.data)['timestamp'] == 100.0
+
+def test_current_state_returns_early_on_update(client, store):
+    """Test that a waiting request is answered as soon as a new state arrives"""
+    timer = threading.Timer(0.05, store.update_state, args=(GoKartState(timestamp=101.0),))
+    timer.start()
+    try:
+        start = time.monotonic()
+        response = client.get('/api/state/current?since=100.0&wait=5')
+        assert time.monotonic() - start < 1.0
+    finally:
+        timer.cancel()
+    assert json.loads(response.data)['timestamp'] == 101.0
+
+def test_current_state_wait_is_capped(client):
+    """Test that the requested wait is limited to MAX_STATE_WAIT"""
+    with patch.object(collector_api, 'MAX_STATE_WAIT', 0.1):
+        start = time.monotonic()
+        client.get('/api/state/current?since=100.0&wait=60')
+        assert time.monotonic() - start < 1.0
@@ -0,0 +1,98 @@
+"""
+Tests for the /api/command route, built through the app factory with a mocked CAN interface
+"""
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import json
+
+# Server directory for the api package and project root for the shared modules, as in app.py
+SERVER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+PROJECT_ROOT = os.path.abspath(os.path.join(SERVER_DIR, '../..'))
+for path in (PROJECT_ROOT, SERVER_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from app_factory import create_app
+
+@pytest.fixture
+def can_interface():
+    can_interface = MagicMock()
+    can_interface.send_command.return_value = True
+    return can_interface
+
+@pytest.fixture
+def client(can_interface):
+    # Only the HTTP routes are exercised, so the Socket.IO server is left out
+    with patch('app_factory.SocketIO'):
+        app, _ = create_app(MagicMock(), can_interface, MagicMock())
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+def test_send_command(client, can_interface):
+    """Test that a complete command is passed to the CAN interface"""
+    command = {
+        'component_type': 'LIGHTS',
+        'component_name': 'ALL',
+        'command_name': 'MODE',
+        'direct_value': 1
+    }
+    response = client.post('/api/command',
+                           data=json.dumps(command),
+                           content_type='application/json')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['status'] == 'success'
+    assert data['details']['component_path'] == 'lights.ALL'
+    can_interface.send_command.assert_called_once_with(
+        message_type_name='COMMAND',
+        component_type_name='LIGHTS',
+        component_name='ALL',
+        command_name='MODE',
+        value_type=None,
+        value_name=None,
+        direct_value=1
+    )
+
+def test_send_command_missing_fields(client, can_interface):
+    """Test that /api/command rejects commands without a component type, name or command"""
+    for missing in ('component_type', 'component_name', 'command_name'):
+        command = {
+            'component_type': 'LIGHTS',
+            'component_name': 'ALL',
+            'command_name': 'MODE',
+            'direct_value': 1
+        }
+        del command[missing]
+        response = client.post('/api/command',
+                               data=json.dumps(command),
+                               content_type='application/json')
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data['status'] == 'error'
+    can_interface.send_command.assert_not_called()
+
+def test_send_command_invalid_body(client, can_interface):
+    """Test that /api/command rejects bodies that aren't a JSON object"""
+    for body in ('not json', '[1, 2]'):
+        response = client.post('/api/command', data=body, content_type='application/json')
+        assert response.status_code == 400
+    can_interface.send_command.assert_not_called()
+
+def test_send_command_failure(client, can_interface):
+    """Test that a command the CAN interface couldn't send is reported as an error"""
+    can_interface.send_command.return_value = False
+    command = {
+        'component_type': 'LIGHTS',
+        'component_name': 'ALL',
+        'command_name': 'MODE',
+        'direct_value': 1
+    }
+    response = client.post('/api/command',
+                           data=json.dumps(command),
+                           content_type='application/json')
+    data = json.loads(response.data)
+    assert data['status'] == 'error'
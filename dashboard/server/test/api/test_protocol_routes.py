@@ -0,0 +1,70 @@
+"""
+Tests for /api/protocol revalidation and compression, built through the app factory
+"""
+import gzip
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import json
+
+# Server directory for the api package and project root for the shared modules, as in app.py
+SERVER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+PROJECT_ROOT = os.path.abspath(os.path.join(SERVER_DIR, '../..'))
+for path in (PROJECT_ROOT, SERVER_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from app_factory import create_app
+
+REGISTRY = {'components': {'lights': {'type_id': 1, 'components': {'FRONT': 0}, 'commands': {}}}}
+
+@pytest.fixture
+def client():
+    protocol_registry = MagicMock()
+    protocol_registry.registry = REGISTRY
+    # Only the HTTP routes are exercised, so the Socket.IO server is left out
+    with patch('app_factory.SocketIO'):
+        app, _ = create_app(MagicMock(), MagicMock(), protocol_registry)
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+def test_protocol_plain(client):
+    """Test that clients without gzip get the uncompressed registry"""
+    response = client.get('/api/protocol', headers={'Accept-Encoding': 'identity'})
+    assert response.status_code == 200
+    assert response.content_encoding is None
+    assert json.loads(response.data) == REGISTRY
+    assert response.get_etag()[0]
+
+def test_protocol_gzip(client):
+    """Test that gzip clients get the precompressed body with its own ETag"""
+    plain = client.get('/api/protocol', headers={'Accept-Encoding': 'identity'})
+    response = client.get('/api/protocol', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.content_encoding == 'gzip'
+    assert 'Accept-Encoding' in response.vary
+    assert json.loads(gzip.decompress(response.data)) == REGISTRY
+    assert response.get_etag()[0] != plain.get_etag()[0]
+
+@pytest.mark.parametrize('encoding', ['identity', 'gzip'])
+def test_protocol_not_modified(client, encoding):
+    """Test that a request with the current ETag gets an empty 304"""
+    etag = client.get('/api/protocol', headers={'Accept-Encoding': encoding}).get_etag()[0]
+    response = client.get('/api/protocol', headers={
+        'Accept-Encoding': encoding,
+        'If-None-Match': f'"{etag}"'
+    })
+    assert response.status_code == 304
+    assert response.data == b''
+
+def test_protocol_stale_etag(client):
+    """Test that a request with an outdated ETag gets the full body"""
+    response = client.get('/api/protocol', headers={
+        'Accept-Encoding': 'identity',
+        'If-None-Match': '"outdated"'
+    })
+    assert response.status_code == 200
+    assert json.loads(response.data) == REGISTRY
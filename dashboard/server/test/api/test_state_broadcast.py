@@ -0,0 +1,52 @@
+"""
+Tests for the helpers the update task uses to build and gate state_batch broadcasts
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# api.endpoints monkey-patches with eventlet when imported
+pytest.importorskip('eventlet')
+
+from api import endpoints
+from api.endpoints import client_backlog, state_deltas
+
+def test_state_deltas_first_state_is_full():
+    """Test that without a previous state the first state is sent whole"""
+    states = [{'timestamp': 1.0, 'value': 3, 'component_id': 'FRONT'}]
+    assert state_deltas(states, None) == states
+
+def test_state_deltas_only_changed_fields():
+    """Test that each state is reduced to the fields that differ from the one before it"""
+    previous = {'timestamp': 1.0, 'value': 3, 'component_id': 'FRONT'}
+    states = [
+        {'timestamp': 2.0, 'value': 3, 'component_id': 'FRONT'},
+        {'timestamp': 3.0, 'value': 4, 'component_id': 'REAR'},
+        {'timestamp': 3.0, 'value': 4, 'component_id': 'REAR'},
+    ]
+    assert state_deltas(states, previous) == [
+        {'timestamp': 2.0},
+        {'timestamp': 3.0, 'value': 4, 'component_id': 'REAR'},
+        {},
+    ]
+
+def test_state_deltas_keeps_new_fields():
+    """Test that a field missing from the previous state counts as changed"""
+    assert state_deltas([{'timestamp': 2.0, 'value': 5}], {'timestamp': 2.0}) == [{'value': 5}]
+
+def test_client_backlog_counts_queued_packets():
+    """Test that the backlog is the size of the client's Engine.IO send queue"""
+    eio_socket = MagicMock()
+    eio_socket.queue.qsize.return_value = 3
+    socketio = MagicMock()
+    socketio.server.eio.sockets = {'eio-1': eio_socket}
+    with patch.object(endpoints, 'socketio', socketio):
+        assert client_backlog('eio-1') == 3
+        assert client_backlog('eio-gone') == 0
+
+def test_client_backlog_tolerates_other_engineio_versions():
+    """Test that missing Engine.IO internals read as an empty backlog instead of raising"""
+    socketio = MagicMock()
+    socketio.server.eio = object()
+    with patch.object(endpoints, 'socketio', socketio):
+        assert client_backlog('eio-1') == 0
@@ -0,0 +1,58 @@
+"""
+Tests for the /api/telemetry/status TTL cache, built through the app factory
+"""
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import json
+
+# Server directory for the api package and project root for the shared modules, as in app.py
+SERVER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+PROJECT_ROOT = os.path.abspath(os.path.join(SERVER_DIR, '../..'))
+for path in (PROJECT_ROOT, SERVER_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from api import telemetry
+from app_factory import create_app
+
+@pytest.fixture
+def collector_session():
+    session = MagicMock()
+    session.get.return_value.content = b'{"collector_connected": true}'
+    # Start from an empty cache and a monotonic clock the test controls
+    clock = MagicMock(wraps=time)
+    clock.monotonic.return_value = 1000.0
+    with patch.object(telemetry, 'collector_session', session), \
+            patch.object(telemetry, '_cached_status', (0.0, None)), \
+            patch.object(telemetry, 'time', clock):
+        yield session
+
+@pytest.fixture
+def client(collector_session):
+    # Only the HTTP routes are exercised, so the Socket.IO server is left out
+    with patch('app_factory.SocketIO'):
+        app, _ = create_app(MagicMock(), MagicMock(), MagicMock())
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+def test_status_cached_within_ttl(client, collector_session):
+    """Test that polls within STATUS_CACHE_TTL share one collector request"""
+    for _ in range(3):
+        response = client.get('/api/telemetry/status')
+        assert response.status_code == 200
+        assert json.loads(response.data) == {'collector_connected': True}
+    assert collector_session.get.call_count == 1
+
+def test_status_refetched_after_ttl(client, collector_session):
+    """Test that the collector is asked again once the cached status expires"""
+    client.get('/api/telemetry/status')
+    collector_session.get.return_value.content = b'{"collector_connected": false}'
+    telemetry.time.monotonic.return_value += telemetry.STATUS_CACHE_TTL
+    response = client.get('/api/telemetry/status')
+    assert json.loads(response.data) == {'collector_connected': False}
+    assert collector_session.get.call_count == 2
@@ -247,6 +247,74 @@ class TestProtocolRegistry(unittest.TestCase):
                 
                 break
 
+    def test_get_component_by_name(self):
+        """Test that component type lookups by name ignore case"""
+        for comp_type, components in self.registry.registry['components'].items():
+            entry = self.registry.get_component_by_name(comp_type.upper())
+            self.assertIsNotNone(entry)
+            self.assertIs(entry, self.registry.get_component_by_name(comp_type.title()))
+            self.assertEqual(entry['components'], components)
+            self.assertEqual(entry['commands'], self.registry.registry['commands'].get(comp_type, {}))
+            self.assertEqual(entry['component_type'], self.registry.get_component_type(comp_type))
+
+        self.assertIsNone(self.registry.get_component_by_name("NONEXISTENT_TYPE"))
+
+    def test_get_command_by_name(self):
+        """Test that command lookups by name ignore case"""
+        for comp_type, commands in self.registry.registry['commands'].items():
+            for cmd_name, cmd_info in commands.items():
+                self.assertEqual(self.registry.get_command_by_name(comp_type.upper(), cmd_name.lower()), cmd_info)
+
+        self.assertIsNone(self.registry.get_command_by_name("lights", "NONEXISTENT_COMMAND"))
+
+    def test_command_lookups_ignore_case(self):
+        """Test that command id and value lookups accept command names in any case"""
+        for comp_type, commands in self.registry.registry['commands'].items():
+            for cmd_name, cmd_info in commands.items():
+                self.assertEqual(self.registry.get_command_id(comp_type, cmd_name.lower()), cmd_info.get('id'))
+                for value_name, value in cmd_info.get('values', {}).items():
+                    self.assertEqual(self.registry.get_command_value(comp_type, cmd_name.lower(), value_name), value)
+
+        # Enum names that aren't upper case resolve by their own spelling and any other
+        self.registry.registry['commands'].setdefault('lights', {})['Blink'] = {'id': 99, 'values': {'FAST': 3}}
+        self.registry._build_indexes()
+        for name in ('Blink', 'BLINK', 'blink'):
+            self.assertEqual(self.registry.get_command_id('lights', name), 99)
+            self.assertEqual(self.registry.get_command_value('lights', name, 'FAST'), 3)
+
+    def test_get_component_id_and_command_value(self):
+        """Test the flat id/value tables against the nested registry"""
+        for comp_type, components in self.registry.registry['components'].items():
+            for comp_name, comp_id in components.items():
+                self.assertEqual(self.registry.get_component_id(comp_type.upper(), comp_name), comp_id)
+
+        for comp_type, commands in self.registry.registry['commands'].items():
+            for cmd_name, cmd_info in commands.items():
+                for value_name, value in cmd_info.get('values', {}).items():
+                    self.assertEqual(self.registry.get_command_value(comp_type, cmd_name, value_name), value)
+
+        self.assertIsNone(self.registry.get_component_id("lights", "NONEXISTENT_COMPONENT"))
+        self.assertIsNone(self.registry.get_command_value("lights", "MODE", "NONEXISTENT_VALUE"))
+
+    def test_reverse_lookups(self):
+        """Test that id -> name lookups round-trip the name -> id tables"""
+        for comp_type, components in self.registry.registry['components'].items():
+            type_id = self.registry.get_component_type(comp_type)
+            self.assertEqual(self.registry.get_component_type_name(type_id), comp_type.upper())
+            for comp_name, comp_id in components.items():
+                self.assertEqual(
+                    self.registry.get_component_id(comp_type, self.registry.get_component_id_name(type_id, comp_id)),
+                    comp_id)
+
+            for cmd_name, cmd_info in self.registry.registry['commands'].get(comp_type, {}).items():
+                self.assertEqual(self.registry.get_command_name(type_id, cmd_info['id']), cmd_name)
+                for value_name, value in cmd_info.get('values', {}).items():
+                    name = self.registry.get_command_value_name(type_id, cmd_info['id'], value)
+                    self.assertEqual(cmd_info['values'][name], value)
+
+        self.assertEqual(self.registry.get_component_type_name(-1), '')
+        self.assertIsNone(self.registry.get_message_type_name(-1))
+
     def test_create_message(self):
         """Test that we can create a complete message tuple"""
         # Get a valid message type, component type, etc. from the registry
@@ -299,5 +367,9 @@ class TestProtocolRegistry(unittest.TestCase):
             self.assertEqual(comp_id, self.registry.get_component_id(comp_type.lower(), comp_name))
             self.assertEqual(cmd_id, self.registry.get_command_id(comp_type.lower(), cmd_name))
 
+            # A repeated call is served from the header cache with the same result
+            self.assertEqual(self.registry.create_message(msg_type, comp_type, comp_name, cmd_name), msg_tuple)
+            self.assertIn((msg_type, comp_type, comp_name, cmd_name, None, None), self.registry._message_header_cache)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
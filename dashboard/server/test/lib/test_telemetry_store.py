@@ -0,0 +1,48 @@
+"""
+Tests for TelemetryStore.wait_for_update, which the collector's long-poll blocks on
+"""
+import os
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+# Project root for the shared modules, as in app.py
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from shared.lib.python.telemetry.state import GoKartState
+from shared.lib.python.telemetry.store import TelemetryStore
+
+def make_store():
+    store = TelemetryStore(protocol=MagicMock())
+    store.update_state(GoKartState(value=1, timestamp=100.0))
+    return store
+
+def test_wait_for_update_times_out_without_a_new_state():
+    """Test that waiting on the current timestamp returns False once the timeout passes"""
+    store = make_store()
+    start = time.monotonic()
+    assert store.wait_for_update(100.0, 0.2) is False
+    assert time.monotonic() - start >= 0.2
+
+def test_wait_for_update_wakes_on_update():
+    """Test that an update wakes the waiter well before its timeout"""
+    store = make_store()
+    timer = threading.Timer(0.05, store.update_state, args=(GoKartState(value=2, timestamp=101.0),))
+    timer.start()
+    try:
+        start = time.monotonic()
+        assert store.wait_for_update(100.0, 5.0) is True
+        assert time.monotonic() - start < 1.0
+    finally:
+        timer.cancel()
+    assert store.state.timestamp == 101.0
+
+def test_wait_for_update_returns_at_once_for_stale_timestamp():
+    """Test that a caller holding an older state doesn't wait at all"""
+    store = make_store()
+    start = time.monotonic()
+    assert store.wait_for_update(99.0, 5.0) is True
+    assert time.monotonic() - start < 0.1
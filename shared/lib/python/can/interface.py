@@ -26,6 +26,8 @@ It is not responsible for:
 import logging
 import os
 import platform
+import select
+import sys
 import time
 import threading
 from cffi import FFI
@@ -77,10 +79,24 @@ ffi.cdef("""
         uint32_t destination_node_id
     );
     void can_interface_process(can_interface_t handle);
+    int can_interface_process_all(can_interface_t handle, int max_messages);
+    int can_interface_get_fd(can_interface_t handle);
 """)
 
+# Destination passed to the C API when none is given; the C++ side treats UINT32_MAX as
+# "use the sender's node ID"
+UINT32_MAX = 0xFFFFFFFF
+
+# Upper bound on frames drained per process() call so one burst can't starve other threads
+PROCESS_BATCH_SIZE = 64
+
+# Longest the processing thread blocks waiting for a frame, so stop_processing() is noticed
+PROCESS_WAIT_TIMEOUT = 0.5
+
 # Global flag to track if we have hardware CAN support
 has_can_hardware = False
+has_process_all = False
+has_get_fd = False
 lib = None
 
 # Try to load the library, but don't fail if it can't be loaded
@@ -99,6 +115,9 @@ try:
     logger.info(f"Loading CAN interface library from: {lib_path}")
     lib = ffi.dlopen(lib_path)
     has_can_hardware = True
+    # Library builds that predate can_interface_process_all only read one frame per call
+    has_process_all = hasattr(lib, 'can_interface_process_all')
+    has_get_fd = hasattr(lib, 'can_interface_get_fd')
     logger.info("CAN interface library loaded successfully")
 except Exception as e:
     logger.warning(f"Failed to load CAN interface library: {e}")
@@ -111,7 +130,8 @@ class CANInterfaceWrapper:
     for sending and receiving CAN messages.
     """
     
-    def __init__(self, node_id=0x01, channel='can0', baudrate=500000, telemetry_store: TelemetryStore = None):
+    def __init__(self, node_id=0x01, channel='can0', baudrate=500000, telemetry_store: TelemetryStore = None,
+                 protocol_registry: ProtocolRegistry = None):
         """
         Initialize the CAN interface.
         
@@ -131,8 +151,8 @@ class CANInterfaceWrapper:
         self._can_interface = None
         self.has_can_hardware = has_can_hardware
         
-        # Load protocol definitions
-        self.protocol_registry = ProtocolRegistry()
+        # Reuse the caller's protocol registry; only load the definitions ourselves if none was given
+        self.protocol_registry = protocol_registry or ProtocolRegistry()
         
         # Initialize lookup dictionaries for reverse mapping (numeric value to name)
         self.message_types_by_value = {v: k for k, v in self.protocol_registry.registry['message_types'].items()}
@@ -175,36 +195,39 @@ class CANInterfaceWrapper:
         """Default message handler: Stores telemetry using collector receive time."""
 
         current_collector_time = time.time()
-        self.logger.info(f"Received message from node {source_node_id:#04x}: Type={msg_type} CompT={comp_type} CompID={comp_id} CmdID={cmd_id} ValT={val_type} Val={value} Delta={timestamp_delta}")
-
         # --- Simplified Approach: Use Collector Time --- 
         recorded_at = current_collector_time
-        self.logger.debug(f"Using collector time as recorded_at: {recorded_at:.4f}")
         # ------------------------------------------- 
 
+        # Check the level once per frame before packing the log arguments; with INFO off
+        # (the usual production setting) this skips both calls entirely
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Received message from node %#04x: Type=%s CompT=%s CompID=%s CmdID=%s ValT=%s Val=%s Delta=%s",
+                             source_node_id, msg_type, comp_type, comp_id, cmd_id, val_type, value, timestamp_delta)
+            self.logger.debug("Using collector time as recorded_at: %.4f", recorded_at)
+
         if not self.telemetry_store:
             logger.error("Telemetry store is not set, dropping message")
             return
 
-        state_data = {
-            'timestamp': recorded_at, # Maps to recorded_at in DB
-            'message_type': msg_type,
-            'component_type': comp_type,
-            'component_id': comp_id,
-            'command_id': cmd_id,
-            'value_type': val_type,
-            'value': value
-        }
-        
-        state_data = GoKartState(**state_data)
+        # Built directly rather than via an intermediate kwargs dict; this runs for every frame
+        state_data = GoKartState(
+            message_type=msg_type,
+            component_type=comp_type,
+            component_id=comp_id,
+            command_id=cmd_id,
+            value_type=val_type,
+            value=value,
+            timestamp=recorded_at # Maps to recorded_at in DB
+        )
 
         # --- Timing Update State --- 
-        t_before_update = time.time()
+        t_before_update = time.monotonic()
         self.telemetry_store.update_state(state_data)
-        t_after_update = time.time()
+        t_after_update = time.monotonic()
         update_duration = (t_after_update - t_before_update) * 1000 # milliseconds
         if update_duration > 10: # Log if update takes > 10ms
-            self.logger.warning(f"_handle_message: telemetry_store.update_state took {update_duration:.2f} ms")
+            self.logger.warning("_handle_message: telemetry_store.update_state took %.2f ms", update_duration)
         # --------------------------- 
     
     def _register_default_handlers(self):
@@ -277,7 +300,8 @@ class CANInterfaceWrapper:
             cmd_id,
             callback  # Pass the CFFI callback object
         )
-        print(f"Registered handler for msg_type={msg_type}, comp_type={comp_type}, comp_id={comp_id}, cmd_id={cmd_id}")
+        self.logger.debug("Registered handler for msg_type=%s, comp_type=%s, comp_id=%s, cmd_id=%s",
+                          msg_type, comp_type, comp_id, cmd_id)
     
     def send_message(self, msg_type, comp_type, comp_id, cmd_id, value_type, value,
                      delay_override: Optional[int] = None,
@@ -296,21 +320,15 @@ class CANInterfaceWrapper:
         Returns:
             bool: True if sent successfully, False otherwise.
         """
-        c_delay_override = -1 if delay_override is None else int(delay_override)
-        if not (-128 <= c_delay_override <= 127):
-            self.logger.warning(f"delay_override {delay_override} out of range. Using -1.")
+        # The common case passes neither override, so skip the conversions and range check
+        if delay_override is None:
             c_delay_override = -1
+        else:
+            c_delay_override = int(delay_override)
+            if not (-128 <= c_delay_override <= 127):
+                self.logger.warning(f"delay_override {delay_override} out of range. Using -1.")
+                c_delay_override = -1
 
-        # Use UINT32_MAX (approx 4 billion) to represent no specific destination in C++
-        # We need its actual value. Let's assume it's large enough that None maps to it.
-        # A safer way might be to get it from ffi or define it.
-        # For now, map None -> UINT32_MAX (represented by -1 cast to uint32 in C? Check C behavior)
-        # Let's use 0xFFFFFFFF explicitly if possible, or a large known value if not.
-        # A default parameter in C++ handles UINT32_MAX, so passing a specific large value
-        # might not be necessary if the C API uses a convention (e.g., 0 or -1 means broadcast/default).
-        # Let's stick to the C++ default logic: UINT32_MAX means use sender ID.
-        # We need to represent UINT32_MAX in Python.
-        UINT32_MAX = 0xFFFFFFFF 
         c_destination_node_id = UINT32_MAX if destination_node_id is None else int(destination_node_id)
 
         return lib.can_interface_send_message(
@@ -350,12 +368,14 @@ class CANInterfaceWrapper:
                 command_name, value_type, value_name, direct_value
             )
 
-            log_extra = ""
-            if delay_override is not None:
-                log_extra += f" w/ delay_override={delay_override}"
-            if destination_node_id is not None:
-                 log_extra += f" to node={destination_node_id:#04x}" # Log destination
-            self.logger.info(f"Sending command: {message_type_name} {component_type_name} {component_name} {command_name} {value_name or direct_value}{log_extra}")
+            # Only build the log line when INFO is enabled; every send goes through here
+            if self.logger.isEnabledFor(logging.INFO):
+                log_extra = ""
+                if delay_override is not None:
+                    log_extra += f" w/ delay_override={delay_override}"
+                if destination_node_id is not None:
+                     log_extra += f" to node={destination_node_id:#04x}" # Log destination
+                self.logger.info(f"Sending command: {message_type_name} {component_type_name} {component_name} {command_name} {value_name or direct_value}{log_extra}")
 
             # Call send_message with the optional parameters
             return self.send_message(msg_type, comp_type, comp_id, cmd_id, val_type, val,
@@ -366,16 +386,53 @@ class CANInterfaceWrapper:
             return False
     
     def process(self):
-        """Process CAN messages once."""
-        # Process messages using the C++ library if available
-        lib.can_interface_process(self._can_interface)
+        """Process all pending CAN messages (up to PROCESS_BATCH_SIZE)."""
+        # Drain the socket in one C call instead of one frame per polling interval
+        if has_process_all:
+            lib.can_interface_process_all(self._can_interface, PROCESS_BATCH_SIZE)
+        else:
+            lib.can_interface_process(self._can_interface)
     
-    def start_processing(self, interval=0.01):
+    def _tune_process_thread(self, cpu, realtime_priority):
+        """
+        Pin the calling thread to a CPU and/or give it SCHED_FIFO priority.
+        
+        Failures (no CAP_SYS_NICE, non-Linux platform, invalid CPU) are logged and ignored;
+        the thread then keeps running with the default scheduling. Under eventlet's
+        monkey-patched threading the "thread" is a greenlet sharing the OS thread with the
+        web servers, so the tuning is skipped rather than applied to the whole hub.
+        """
+        patcher = sys.modules.get('eventlet.patcher')
+        if patcher is not None and patcher.is_monkey_patched('thread'):
+            self.logger.warning("Threading is monkey-patched by eventlet; "
+                                "not applying CPU affinity or SCHED_FIFO to the CAN processing loop")
+            return
+        if cpu is not None:
+            try:
+                os.sched_setaffinity(0, {cpu})
+                self.logger.info("CAN processing thread pinned to CPU %s", cpu)
+            except (AttributeError, OSError, ValueError) as e:
+                self.logger.warning("Could not pin CAN processing thread to CPU %s: %s", cpu, e)
+        if realtime_priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(realtime_priority))
+                self.logger.info("CAN processing thread using SCHED_FIFO priority %s", realtime_priority)
+            except (AttributeError, OSError, ValueError) as e:
+                self.logger.warning("Could not set SCHED_FIFO priority %s for CAN processing thread: %s",
+                                    realtime_priority, e)
+
+    def start_processing(self, interval=0.01, cpu=None, realtime_priority=None):
         """
         Start a background thread to process CAN messages.
         
+        When the library exposes the socket's file descriptor the thread sleeps in select()
+        until a frame arrives; otherwise it polls every `interval`.
+        
         Args:
             interval (float): The interval in seconds at which to process messages.
+            cpu (int, optional): CPU to pin the processing thread to (Linux only).
+            realtime_priority (int, optional): SCHED_FIFO priority (1-99) for the processing
+                thread, so frames are handled ahead of the web servers (needs CAP_SYS_NICE).
         """
         if self.auto_process:
             return
@@ -384,9 +441,24 @@ class CANInterfaceWrapper:
         
         def process_loop():
             """Background thread function to continuously process messages."""
+            # Scheduling calls with pid 0 apply to the calling OS thread only, so tune from
+            # inside the loop's own thread
+            if cpu is not None or realtime_priority is not None:
+                self._tune_process_thread(cpu, realtime_priority)
+            # Resolve the per-iteration callables once; this loop runs for the life of the process
+            process = self.process
+            fd = lib.can_interface_get_fd(self._can_interface) if has_get_fd else -1
+            if fd >= 0:
+                wait = select.select
+                readers = [fd]
+                while self.auto_process:
+                    if wait(readers, (), (), PROCESS_WAIT_TIMEOUT)[0]:
+                        process()
+                return
+            sleep = time.sleep
             while self.auto_process:
-                self.process()
-                time.sleep(interval)
+                process()
+                sleep(interval)
         
         self.process_thread = threading.Thread(target=process_loop, daemon=True)
         self.process_thread.start()
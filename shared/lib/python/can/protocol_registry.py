@@ -33,8 +33,22 @@ class ProtocolRegistry:
         self.pb_path = self._resolve_protocol_path(pb_path)
         self.modules = {}
         self.registry = {}
+        self._component_index = {}
+        self._command_index = {}
+        self._component_id_index = {}
+        self._command_value_index = {}
+        # Reverse (id -> name) tables for decoding received messages
+        self._message_type_names = {}
+        self._component_type_names = {}
+        self._value_type_names = {}
+        self._component_id_names = {}
+        self._command_names = {}
+        self._command_value_names = {}
+        # (message_type, component_type, component_name, command_name, value_type, value_name) -> resolved ids
+        self._message_header_cache = {}
         self._load_modules()
         self._build_registry()
+        self._build_indexes()
         
     def _resolve_protocol_path(self, pb_path: str = None) -> str:
         """Intelligently find the protocol directory"""
@@ -126,25 +140,67 @@ class ProtocolRegistry:
                 self._extract_component_enums(module)
         
         # Log the extracted registry for debugging
-        self.logger.debug(f"Extracted message_types: {self.registry['message_types']}")
-        self.logger.debug(f"Extracted component_types: {self.registry['component_types']}")
-        self.logger.debug(f"Extracted value_types: {self.registry['value_types']}")
+        self.logger.debug("Extracted message_types: %s", self.registry['message_types'])
+        self.logger.debug("Extracted component_types: %s", self.registry['component_types'])
+        self.logger.debug("Extracted value_types: %s", self.registry['value_types'])
     
+    def _build_indexes(self) -> None:
+        """Precompute case-normalized lookup tables so name and id lookups are a single dict hit"""
+        self._component_index = {}
+        self._command_index = {}
+        self._component_id_index = {}
+        self._command_value_index = {}
+        self._message_type_names = self._reverse(self.registry['message_types'])
+        self._component_type_names = self._reverse(self.registry['component_types'])
+        self._value_type_names = self._reverse(self.registry['value_types'])
+        self._component_id_names = {}
+        self._command_names = {}
+        self._command_value_names = {}
+
+        for component_type, components in self.registry['components'].items():
+            entry = {
+                'component_type': self.registry['component_types'].get(component_type.upper()),
+                'components': components,
+                'commands': self.registry['commands'].get(component_type, {})
+            }
+            for key in (component_type, component_type.lower(), component_type.upper()):
+                self._component_index[key] = entry
+            for component_name, component_id in components.items():
+                self._component_id_index[(component_type.lower(), component_name)] = component_id
+                self._component_id_names.setdefault((component_type.lower(), component_id), component_name)
+
+        for component_type, commands in self.registry['commands'].items():
+            for command_name, command in commands.items():
+                self._command_index[(component_type.lower(), command_name.upper())] = command
+                self._command_names.setdefault((component_type.lower(), command.get('id')), command_name)
+                for value_name, value in command.get('values', {}).items():
+                    self._command_value_index[(component_type.lower(), command_name.upper(), value_name)] = value
+                    self._command_value_names.setdefault(
+                        (component_type.lower(), command.get('id'), value), value_name)
+
+    @staticmethod
+    def _reverse(names: Dict[str, int]) -> Dict[int, str]:
+        """Map each value back to the first name that has it"""
+        reverse = {}
+        for name, value in names.items():
+            reverse.setdefault(value, name)
+        return reverse
+
     def _extract_common_enums(self, module: Any) -> None:
         """Extract common message, component, and value type enums"""
         try:
             # Direct extraction of well-known enums
             if hasattr(module, 'MessageType') and hasattr(module.MessageType, 'items'):
                 self.registry['message_types'] = dict(module.MessageType.items())
-                self.logger.debug(f"Extracted MessageType enum: {self.registry['message_types']}")
+                self.logger.debug("Extracted MessageType enum: %s", self.registry['message_types'])
                 
             if hasattr(module, 'ComponentType') and hasattr(module.ComponentType, 'items'):
                 self.registry['component_types'] = dict(module.ComponentType.items())
-                self.logger.debug(f"Extracted ComponentType enum: {self.registry['component_types']}")
+                self.logger.debug("Extracted ComponentType enum: %s", self.registry['component_types'])
                 
             if hasattr(module, 'ValueType') and hasattr(module.ValueType, 'items'):
                 self.registry['value_types'] = dict(module.ValueType.items())
-                self.logger.debug(f"Extracted ValueType enum: {self.registry['value_types']}")
+                self.logger.debug("Extracted ValueType enum: %s", self.registry['value_types'])
         except Exception as e:
             self.logger.error(f"Error extracting common enums: {e}")
     
@@ -181,24 +237,25 @@ class ProtocolRegistry:
                 # ComponentId enums
                 if attr_name.endswith('ComponentId'):
                     component_id_enum = attr
-                    self.logger.debug(f"Found component ID enum: {attr_name}")
+                    self.logger.debug("Found component ID enum: %s", attr_name)
                 
                 # CommandId enums
                 elif attr_name.endswith('CommandId'):
                     command_id_enum = attr
-                    self.logger.debug(f"Found command ID enum: {attr_name}")
+                    self.logger.debug("Found command ID enum: %s", attr_name)
                 
                 # Value enums
                 elif attr_name.endswith('Value'):
                     value_enums[attr_name] = attr
-                    self.logger.debug(f"Found value enum: {attr_name} with values: {dict(attr.items())}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Found value enum: %s with values: %s", attr_name, dict(attr.items()))
             
-            self.logger.debug(f"All enums in module {module.__name__}: {enums_in_module}")
+            self.logger.debug("All enums in module %s: %s", module.__name__, enums_in_module)
             
             # Process component ID enum
             if component_id_enum:
                 component_ids = dict(component_id_enum.items())
-                self.logger.debug(f"Component IDs for {component_type}: {component_ids}")
+                self.logger.debug("Component IDs for %s: %s", component_type, component_ids)
                 
                 # For each component ID, create a component entry
                 for comp_name, comp_id in component_ids.items():
@@ -208,12 +265,12 @@ class ProtocolRegistry:
                         
                     # Store component ID directly, not in a nested dictionary
                     self.registry['components'][component_type][comp_name] = comp_id
-                    self.logger.debug(f"Added component {comp_name} (ID: {comp_id}) to {component_type}")
+                    self.logger.debug("Added component %s (ID: %s) to %s", comp_name, comp_id, component_type)
             
             # Process command ID enum
             if command_id_enum:
                 command_ids = dict(command_id_enum.items())
-                self.logger.debug(f"Command IDs for {component_type}: {command_ids}")
+                self.logger.debug("Command IDs for %s: %s", component_type, command_ids)
                 
                 command_to_value_map = {}
                 component_prefix = component_type.title()  # e.g., "Light" for "lights"
@@ -225,14 +282,14 @@ class ProtocolRegistry:
                     # Try direct match first
                     if expected_enum_name in value_enums:
                         command_to_value_map[cmd_name] = value_enums[expected_enum_name]
-                        self.logger.debug(f"Direct pattern match: {cmd_name} -> {expected_enum_name}")
+                        self.logger.debug("Direct pattern match: %s -> %s", cmd_name, expected_enum_name)
                     else:
                         # Try case-insensitive match
                         for enum_name, enum_obj in value_enums.items():
                             # Try matching by command name in enum name
                             if cmd_name.lower() in enum_name.lower():
                                 command_to_value_map[cmd_name] = enum_obj
-                                self.logger.debug(f"Partial match: {cmd_name} -> {enum_name}")
+                                self.logger.debug("Partial match: %s -> %s", cmd_name, enum_name)
                                 break
                 
                 # Add commands to the top-level commands registry by component type
@@ -247,11 +304,11 @@ class ProtocolRegistry:
                     if cmd_name in command_to_value_map:
                         values_dict = dict(command_to_value_map[cmd_name].items())
                         self.registry['commands'][component_type][cmd_name]['values'] = values_dict
-                        self.logger.debug(f"Added {len(values_dict)} values for {cmd_name}: {list(values_dict.keys())}")
+                        self.logger.debug("Added %d values for %s: %s", len(values_dict), cmd_name, list(values_dict.keys()))
                     else:
-                        self.logger.debug(f"No value enum found for command {cmd_name}")
+                        self.logger.debug("No value enum found for command %s", cmd_name)
                 
-                self.logger.debug(f"Added {len(command_ids)} commands to component type {component_type}")
+                self.logger.debug("Added %d commands to component type %s", len(command_ids), component_type)
                 
         except Exception as e:
             self.logger.error(f"Error extracting component enums: {e}", exc_info=True)
@@ -267,13 +324,13 @@ class ProtocolRegistry:
         # Extract component type directly from module name by removing _pb2 suffix
         if module_name.endswith('_pb2'):
             component_type = module_name.replace('_pb2', '')
-            self.logger.debug(f"Determined component type {component_type} from module name {module_name}")
+            self.logger.debug("Determined component type %s from module name %s", component_type, module_name)
             return component_type
             
         # Extract from module name by checking if it contains a component type name
         for comp_type_name in self.registry['component_types'].keys():
             if comp_type_name.lower() in module_name:
-                self.logger.debug(f"Determined component type {comp_type_name.lower()} from module name {module_name}")
+                self.logger.debug("Determined component type %s from module name %s", comp_type_name.lower(), module_name)
                 return comp_type_name.lower()
         
         # If we couldn't determine from the name, check if there's a ComponentId enum
@@ -281,7 +338,7 @@ class ProtocolRegistry:
             if 'ComponentId' in attr_name and hasattr(module, attr_name) and hasattr(getattr(module, attr_name), 'items'):
                 # Extract component type from the ComponentId enum name
                 component_type = attr_name.replace('ComponentId', '').lower()
-                self.logger.debug(f"Determined component type {component_type} from ComponentId enum {attr_name}")
+                self.logger.debug("Determined component type %s from ComponentId enum %s", component_type, attr_name)
                 return component_type
             
         # If we get here, we couldn't determine the component type
@@ -328,32 +385,29 @@ class ProtocolRegistry:
     
     def get_component_id(self, component_type: str, component_name: str) -> Optional[int]:
         """Get component ID by type and name"""
-        component_type = component_type.lower()
-        if component_type in self.registry['components'] and component_name in self.registry['components'][component_type]:
-            return self.registry['components'][component_type][component_name]
-        return None
+        return self._component_id_index.get((component_type.lower(), component_name))
     
     def get_command_id(self, component_type: str, command_name: str) -> Optional[int]:
-        """Get command ID by component type and command name"""
-        component_type = component_type.lower()
-        if (component_type in self.registry['commands'] and 
-            command_name in self.registry['commands'][component_type]):
-            return self.registry['commands'][component_type][command_name].get('id')
+        """Get command ID by component type and command name (any case)"""
+        command = self._command_index.get((component_type.lower(), command_name.upper()))
+        if command:
+            return command.get('id')
         return None
+
+    def get_component_by_name(self, component_type: str) -> Optional[Dict[str, Any]]:
+        """Get the type ID, components and commands for a component type name (any case)"""
+        return self._component_index.get(component_type) or self._component_index.get(component_type.lower())
+
+    def get_command_by_name(self, component_type: str, command_name: str) -> Optional[Dict[str, Any]]:
+        """Get the command entry (id and values) for a component type and command name (any case)"""
+        return self._command_index.get((component_type.lower(), command_name.upper()))
     
     def get_command_value(self, component_type: str, command_name: str, value_name: str) -> Optional[int]:
-        """Get command value by component type, command name, and value name"""
-        component_type = component_type.lower()
-        if (component_type in self.registry['commands'] and
-            command_name in self.registry['commands'][component_type] and
-            'values' in self.registry['commands'][component_type][command_name] and
-            value_name in self.registry['commands'][component_type][command_name]['values']):
-            return self.registry['commands'][component_type][command_name]['values'][value_name]
-        return None
+        """Get command value by component type, command name (any case), and value name"""
+        return self._command_value_index.get((component_type.lower(), command_name.upper(), value_name))
     
     def get_component_types(self) -> List[str]:
         """Get all registered component types"""
-        print(f"Getting component types: {self.registry['components'].keys()}")
         return list(self.registry['components'].keys())
     
     def get_commands(self, component_type: str) -> List[str]:
@@ -371,16 +425,27 @@ class ProtocolRegistry:
                       value_name: str = None, value: int = None) -> Tuple[Optional[int], Optional[int], Optional[int], 
                                                  Optional[int], Optional[int], Optional[int]]:
         """Create a complete message tuple from high-level parameters"""
-        msg_type = self.get_message_type(message_type)
-        comp_type = self.get_component_type(component_type)
-        comp_id = self.get_component_id(component_type, component_name)
-        cmd_id = self.get_command_id(component_type, command_name)
+        # Commands and their named values come from small fixed sets, so resolve everything
+        # but a direct value once; repeated sends of the same command then cost a single dict hit
+        header_key = (message_type, component_type, component_name, command_name, value_type, value_name)
+        header = self._message_header_cache.get(header_key)
+        if header is None:
+            header = (
+                self.get_message_type(message_type),
+                self.get_component_type(component_type),
+                self.get_component_id(component_type, component_name),
+                self.get_command_id(component_type, command_name),
+                self.get_value_type(value_type or "INT8"),  # Default
+                self.get_command_value(component_type, command_name, value_name) if value_name is not None else None
+            )
+            # Only cache names that resolved so arbitrary input can't grow the cache
+            if None not in header[:5] and (value_name is None or header[5] is not None):
+                self._message_header_cache[header_key] = header
+        msg_type, comp_type, comp_id, cmd_id, val_type, value_by_name = header
         
         # Handle value - either named value or direct integer
-        val_type = self.get_value_type(value_type or "INT8")  # Default
         val = 0
         
-        value_by_name = self.get_command_value(component_type, command_name, value_name)
         if value_by_name:
             val = value_by_name
         elif value is not None:
@@ -390,59 +455,30 @@ class ProtocolRegistry:
     
     def get_message_type_name(self, message_type: int) -> str:
         """Get message type name by value"""
-        # iterate over the values in the message_types dictionary
-        for key, value in self.registry['message_types'].items():
-            if value == message_type:
-                return key
-        return None
+        return self._message_type_names.get(message_type)
     
     def get_component_type_name(self, component_type: int) -> str:
         """Get component type name by value"""
-        # iterate over the values in the component_types dictionary
-        for key, value in self.registry['component_types'].items():
-            if value == component_type:
-                return key
-        return ''
+        return self._component_type_names.get(component_type, '')
     
     def get_component_id_name(self, component_type: str, component_id: int) -> str:
         """Get component ID name by value"""
         component_type_name = self.get_component_type_name(component_type).lower()
-        components_by_type = self.registry['components'].get(component_type_name)
-
-        # iterate over the values in the components_by_type dictionary
-        for key, value in components_by_type.items():
-            if value == component_id:
-                return key
-        return ''
+        return self._component_id_names.get((component_type_name, component_id), '')
     
     def get_command_name(self, component_type: str, command_id: int) -> str:
         """Get command name by value"""
         component_type_name = self.get_component_type_name(component_type).lower()
-
-        # iterate over the commands for this types and check the id value matches the command id
-        for key, value in self.registry['commands'][component_type_name].items():
-            if value['id'] == command_id:
-                return key
-        return ''
+        return self._command_names.get((component_type_name, command_id), '')
     
     def get_command_value_name(self, component_type: str, command_id: int, value_id: int) -> str:
         """Get command value name by value"""
         component_type_name = self.get_component_type_name(component_type).lower()
-        command_name = self.get_command_name(component_type, command_id)
-
-        # iterate over the values in the command's values dictionary
-        for key, value in self.registry['commands'][component_type_name][command_name.upper()]['values'].items():
-            if value == value_id:
-                return key
-        return ''
+        return self._command_value_names.get((component_type_name, command_id, value_id), '')
     
     def get_value_type_name(self, value_type: int) -> str:
         """Get value type name by value"""
-        # iterate over the values in the value_types dictionary
-        for key, value in self.registry['value_types'].items():
-            if value == value_type:
-                return key
-        return ''
+        return self._value_type_names.get(value_type, '')
     
     def dump_registry(self) -> Dict:
         """Return a copy of the complete registry"""
@@ -0,0 +1,34 @@
+"""
+JSON encoding shared by the dashboard and the telemetry collector
+
+Uses orjson when it is installed and falls back to the standard library json module
+otherwise (orjson ships no wheels for the Pi Zero's ARMv6, so it stays optional).
+"""
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    has_orjson = True
+except ImportError:
+    orjson = None
+    has_orjson = False
+    logger.info("orjson not installed, using the standard json module")
+
+
+def loads(data):
+    """Parse a JSON document from bytes or str"""
+    if has_orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes"""
+    if has_orjson:
+        # Coerce int keys to strings like the json module does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
@@ -2,7 +2,7 @@
 
 import logging
 import time
-from typing import List, Dict, Any, Optional, Union
+from typing import Optional
 
 import redis
 from redis.exceptions import RedisError
@@ -33,8 +33,9 @@ class PersistentTelemetryStore(TelemetryStore):
             retention_seconds: How long to keep data for dashboard (seconds)
             stream_key_prefix: Prefix for Redis keys
         """
-        # Pass protocol and memory history limit to base class
-        super().__init__(protocol, limit=1000)
+        # History is read from the Redis stream (get_history is overridden), so keep no
+        # in-memory copy; a zero-length deque drops each state as it is appended
+        super().__init__(protocol, limit=0)
         
         # Set up default configurations if not provided
         self.local_redis_config = local_redis_config or {
@@ -131,11 +132,10 @@ class PersistentTelemetryStore(TelemetryStore):
             node_id: ID of the node sending the telemetry
             
         Returns:
-            Dictionary with state information
+            The stored state
         """
         # Update in-memory state (from base class)
         super().update_state(state)
-        state_dict = state.to_dict()
         
         # Calculate current timestamp
         received_ts = time.time()
@@ -219,7 +219,7 @@ class PersistentTelemetryStore(TelemetryStore):
             # Note: new_message_count is already set by HINCRBY in the pipeline
             # If node_data_partial had other fields relying on count, update them here
 
-            logger.debug(f"Added telemetry record {actual_stream_id} for {component_key}")
+            logger.debug("Added telemetry record %s for %s", actual_stream_id, component_key)
 
             # --- Remote Replication (if applicable) --- 
             if self.role == 'vehicle':
@@ -255,7 +255,7 @@ class PersistentTelemetryStore(TelemetryStore):
         except IndexError:
              logger.error("Redis pipeline result indexing error. Mismatch between commands and results?", exc_info=True)
         
-        return state_dict
+        return state
 
     def get_history(self, limit: int = 100):
         """
@@ -9,6 +9,11 @@ from typing import Dict, Any, Optional
 
 class GoKartState:
     """Class representing the state of a CAN message."""
+
+    # One instance per received frame plus everything held in history; slots keep them small
+    # and make attribute access on the receive path a fixed-offset load instead of a dict lookup
+    __slots__ = ('message_type', 'component_type', 'component_id', 'command_id',
+                 'value_type', 'value', 'timestamp')
     
     def __init__(self, message_type: Optional[int] = None, 
                 component_type: Optional[int] = None,
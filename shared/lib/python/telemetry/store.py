@@ -1,50 +1,58 @@
 from .state import GoKartState
 from shared.lib.python.can.protocol_registry import ProtocolRegistry
-import time
+from collections import deque
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+def _readable_component_id(protocol: ProtocolRegistry, state_dict: dict, value):
+    # Need component_type which should be present in the state object
+    component_type_val = state_dict.get('component_type')
+    if component_type_val is not None:
+        return protocol.get_component_id_name(component_type_val, value)
+    return f"UnknownComponentId({value})"
+
+def _readable_command_id(protocol: ProtocolRegistry, state_dict: dict, value):
+    # Need component_type which should be present in the state object
+    component_type_val = state_dict.get('component_type')
+    if component_type_val is not None:
+        return protocol.get_command_name(component_type_val, value)
+    return f"UnknownCommandId({value})"
+
+def _readable_value(protocol: ProtocolRegistry, state_dict: dict, value):
+    # Need component_type and command_id
+    component_type_val = state_dict.get('component_type')
+    command_id_val = state_dict.get('command_id')
+    if component_type_val is not None and command_id_val is not None:
+        return protocol.get_command_value_name(component_type_val, command_id_val, value)
+    return f"UnknownValue({value})"
+
+# Per-field converters looked up once per key instead of walking an if/elif chain;
+# fields without an entry (e.g. timestamp) are copied through unchanged
+_READABLE_CONVERTERS = {
+    'message_type': lambda protocol, state_dict, value: protocol.get_message_type_name(value),
+    'component_type': lambda protocol, state_dict, value: protocol.get_component_type_name(value),
+    'component_id': _readable_component_id,
+    'command_id': _readable_command_id,
+    'value_type': lambda protocol, state_dict, value: protocol.get_value_type_name(value),
+    'value': _readable_value,
+}
+
 def state_to_readable_dict(state: GoKartState, protocol: ProtocolRegistry) -> dict:
     """Convert a GoKartState object to a readable dictionary format."""
     readable_dict = {}
     state_dict = state.to_dict() # Get base dictionary
     for key, value in state_dict.items():
+        if value is None: # Handle potential None values
+            readable_dict[key] = None
+            continue
+        convert = _READABLE_CONVERTERS.get(key)
+        if convert is None:
+            readable_dict[key] = value
+            continue
         try:
-            if value is None: # Handle potential None values
-                readable_dict[key] = None
-                continue
-                
-            if key == 'message_type':
-                readable_dict[key] = protocol.get_message_type_name(value)
-            elif key == 'component_type':
-                readable_dict[key] = protocol.get_component_type_name(value)
-            elif key == 'component_id':
-                # Need component_type which should be present in the state object
-                component_type_val = state_dict.get('component_type')
-                if component_type_val is not None:
-                    readable_dict[key] = protocol.get_component_id_name(component_type_val, value)
-                else:
-                     readable_dict[key] = f"UnknownComponentId({value})"
-            elif key == 'command_id':
-                 # Need component_type which should be present in the state object
-                component_type_val = state_dict.get('component_type')
-                if component_type_val is not None:
-                    readable_dict[key] = protocol.get_command_name(component_type_val, value)
-                else:
-                    readable_dict[key] = f"UnknownCommandId({value})"
-            elif key == 'value_type':
-                readable_dict[key] = protocol.get_value_type_name(value)
-            elif key == 'value':
-                # Need component_type and command_id
-                component_type_val = state_dict.get('component_type')
-                command_id_val = state_dict.get('command_id')
-                if component_type_val is not None and command_id_val is not None:
-                     readable_dict[key] = protocol.get_command_value_name(component_type_val, command_id_val, value)
-                else:
-                    readable_dict[key] = f"UnknownValue({value})"
-            else:
-                readable_dict[key] = value
+            readable_dict[key] = convert(protocol, state_dict, value)
         except Exception as e:
              logger.error(f"Error converting key '{key}' with value '{value}': {e}", exc_info=True)
              readable_dict[key] = f"ConversionError({value})"
@@ -57,17 +65,38 @@ class TelemetryStore:
         self.limit = limit
 
         # even though we use persistent store, we still need to keep a history for the dashboard
-        self.history = []
-        self.last_update_time = time.time()
+        # bounded deque so the oldest entry is dropped in O(1) instead of list.pop(0);
+        # holds the GoKartState objects themselves, dicts are only built when history is read
+        self.history = deque(maxlen=limit)
+        # Dicts built from the current state, keyed by readable; cleared when the state changes
+        # so repeated polls between frames reuse them
+        self._current_state_dicts = {}
+        self._current_state_dicts_for = None
+        # Notified on every update so readers can block until the state changes instead of polling
+        self._state_changed = threading.Condition()
+
+    @property
+    def last_update_time(self):
+        """Timestamp of the last message, read from the current state rather than tracked separately."""
+        return self.state.timestamp
 
     def get_current_state(self, readable=False):
-        """Return the current state (last message) as a dictionary."""
-        state_dict = self.state.to_dict()
-        state_dict['timestamp'] = self.last_update_time # Ensure latest timestamp
-        if readable:
-            return state_to_readable_dict(self.state, self.protocol)
-        else:
-            return state_dict
+        """Return the current state (last message) as a dictionary.
+
+        The dict is shared by every call until the next message arrives; callers must not modify it.
+        """
+        state = self.state
+        if state is not self._current_state_dicts_for:
+            self._current_state_dicts = {}
+            self._current_state_dicts_for = state
+        state_dict = self._current_state_dicts.get(readable)
+        if state_dict is None:
+            if readable:
+                state_dict = state_to_readable_dict(state, self.protocol)
+            else:
+                state_dict = state.to_dict()
+            self._current_state_dicts[readable] = state_dict
+        return state_dict
 
     def get_history(self, limit=100):
         """
@@ -78,14 +107,27 @@ class TelemetryStore:
         """
         # get limit max self.limit
         _limit = min(limit, self.limit)
-        return self.history[-_limit:]
+        # Snapshot first: tuple(deque) is a single C-level copy, so the CAN thread appending
+        # meanwhile can't raise "deque mutated during iteration" mid-read. No lock needed
+        # since states are never mutated after they are stored.
+        snapshot = tuple(self.history)
+        return [state.to_dict() for state in snapshot[max(len(snapshot) - _limit, 0):]]
 
     def update_state(self, state: GoKartState):
-        """Update the current state (last message received)."""
-        self.state = state
-        self.last_update_time = state.timestamp
-        state_dict = state.to_dict()
-        self.history.append(state_dict)
-        if len(self.history) > self.limit:
-            self.history.pop(0)
-        return state_dict # Return the raw state object instead? Or None?
\ No newline at end of file
+        """Update the current state (last message received) and return it.
+
+        Runs for every received frame; no dict is built here, readers convert on demand.
+        """
+        with self._state_changed:
+            self.state = state
+            self.history.append(state)
+            self._state_changed.notify_all()
+        return state
+
+    def wait_for_update(self, since_timestamp, timeout):
+        """Block until the current state's timestamp differs from since_timestamp or timeout passes.
+
+        Returns True if the state changed.
+        """
+        with self._state_changed:
+            return self._state_changed.wait_for(lambda: self.state.timestamp != since_timestamp, timeout)
\ No newline at end of file
@@ -1,14 +1,16 @@
 """ Telemetry Collector API Endpoints - Supports HTTP REST and WebSocket Upload """
 
 import logging
-import json
 import threading
-import time
 from flask import Flask, jsonify, Blueprint, request
-from shared.lib.python.telemetry.state import GoKartState
+
+from shared.lib.python import fast_json
 
 logger = logging.getLogger(__name__)
 
+# Longest a /state/current request may wait for a new state (long polling)
+MAX_STATE_WAIT = 5.0  # seconds
+
 # Global variable to hold the store instance for WebSocket handler
 # This is a simple approach; dependency injection might be better for complex apps.
 _telemetry_store_instance = None
@@ -26,14 +28,35 @@ def create_api_server_manager(telemetry_store, role: str, http_host: str, http_p
     _telemetry_store_instance = telemetry_store
 
     app = Flask(__name__)
+    # Compact, unsorted jsonify output (Flask < 2.2 config keys, then the JSON provider)
+    app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+    app.config['JSON_SORT_KEYS'] = False
+    if hasattr(app, 'json'):
+        app.json.compact = True
+        app.json.sort_keys = False
     api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+    # Encoded body of the current state, rebuilt only when the store's last state object changes;
+    # the dashboard polls this at 10 Hz per client while CAN updates usually arrive far less often
+    current_state_cache = {'state': None, 'body': None}
+
     # --- Existing HTTP Endpoints --- 
     @api_bp.route('/state/current', methods=['GET'])
     def get_current_state():
+        # Long poll: with ?since=<timestamp>&wait=<seconds>, answer once the state is newer than
+        # the caller's copy (or the wait runs out) so pollers don't wake up for unchanged state
+        since = request.args.get('since', type=float)
+        wait = request.args.get('wait', 0.0, type=float)
+        if since is not None and wait > 0:
+            telemetry_store.wait_for_update(since, min(wait, MAX_STATE_WAIT))
+
         # Get current state from telemetry_store
-        state = telemetry_store.get_current_state(readable=True)
-        return jsonify(state)
+        state_obj = telemetry_store.state
+        if state_obj is not current_state_cache['state']:
+            state = telemetry_store.get_current_state(readable=True)
+            current_state_cache['body'] = fast_json.dumps(state)
+            current_state_cache['state'] = state_obj
+        return app.response_class(current_state_cache['body'], mimetype='application/json')
 
     @api_bp.route('/state/history', methods=['GET'])
     def get_state_history():
@@ -48,7 +71,7 @@ def create_api_server_manager(telemetry_store, role: str, http_host: str, http_p
                 history = telemetry_store.get_history_with_pagination(limit=limit, offset=offset)
             else:
                 history = telemetry_store.get_history(limit=limit)
-            return jsonify(history)
+            return app.response_class(fast_json.dumps(history), mimetype='application/json')
         except Exception as e:
             logger.error(f"Error retrieving history: {e}")
             return jsonify({"error": str(e)}), 500
@@ -57,7 +80,7 @@ def create_api_server_manager(telemetry_store, role: str, http_host: str, http_p
     def get_component_state(comp_type, comp_id):
         state = telemetry_store.get_component_state(comp_type, comp_id)
         if state:
-            return jsonify(state)
+            return app.response_class(fast_json.dumps(state), mimetype='application/json')
         else:
             return jsonify({"error": f"No state found for {comp_type}/{comp_id}"}), 404
 
@@ -70,7 +93,7 @@ def create_api_server_manager(telemetry_store, role: str, http_host: str, http_p
                 'database': telemetry_store.get_database_stats() if hasattr(telemetry_store, 'get_database_stats') else {},
                 'last_message': telemetry_store.get_last_update_time() if hasattr(telemetry_store, 'get_last_update_time') else None
             }
-            return jsonify(status)
+            return app.response_class(fast_json.dumps(status), mimetype='application/json')
         except Exception as e:
             logger.error(f"Error retrieving status: {e}")
             return jsonify({"error": str(e)}), 500
@@ -8,10 +8,8 @@ import signal
 import sys
 import os
 import threading
-import time # For shutdown wait
 import argparse # Import argparse
 import asyncio
-import redis # Add redis import for potential config checks
 
 # Add project root to Python path for shared module imports
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
@@ -174,10 +172,18 @@ def main():
                 node_id=int(str(config.get('DEFAULT', 'CAN_NODE_ID', fallback='0x02')), 0),
                 channel=config.get('DEFAULT', 'CAN_INTERFACE', fallback='can0'),
                 baudrate=config.getint('DEFAULT', 'CAN_BAUDRATE', fallback=500000),
-                telemetry_store=telemetry_store
+                telemetry_store=telemetry_store,
+                protocol_registry=protocol_registry
             )
 
-            can_interface.start_processing()
+            # Optional: pin the CAN thread to a spare core and/or run it SCHED_FIFO
+            try:
+                process_cpu = config.getint('DEFAULT', 'CAN_PROCESS_CPU', fallback=None)
+                process_priority = config.getint('DEFAULT', 'CAN_PROCESS_RT_PRIORITY', fallback=None)
+            except ValueError as e:
+                logger.error(f"Invalid CAN processing thread setting, using default scheduling: {e}")
+                process_cpu = process_priority = None
+            can_interface.start_processing(cpu=process_cpu, realtime_priority=process_priority)
             logger.info("Started CAN message processing thread.")
             
             # Start Time Sync Broadcaster if vehicle and CAN is up
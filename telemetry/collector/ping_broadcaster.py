@@ -1,7 +1,6 @@
 from collections import OrderedDict
 import math
 from typing import Optional
-from shared.lib.python.telemetry.state import GoKartState
 from shared.lib.python.can.interface import CANInterfaceWrapper
 import threading
 import logging
@@ -70,7 +69,7 @@ class PingBroadcaster(threading.Thread):
                 )
 
                 if success:
-                    self.logger.debug(f"Sent PING command with value: {time_value_24bit}")
+                    self.logger.debug("Sent PING command with value: %s", time_value_24bit)
                 else:
                     self.logger.warning("Failed to send PING command.")
 
@@ -111,7 +110,7 @@ class PingBroadcaster(threading.Thread):
         self._rtt_estimates[source_node_id] = self._rtt_estimates[source_node_id][-max_samples:]
         avg_rtt = sum(self._rtt_estimates[source_node_id]) / len(self._rtt_estimates[source_node_id])
         
-        self.logger.debug(f"Received PONG from {source_node_id:#04x}. RTT: {rtt_ms:.2f} ms. Avg RTT: {avg_rtt:.2f} ms.")
+        self.logger.debug("Received PONG from %#04x. RTT: %.2f ms. Avg RTT: %.2f ms.", source_node_id, rtt_ms, avg_rtt)
         
         # --- Send SET_TIME Command --- 
         # Estimate one-way delay (half RTT)
@@ -134,7 +133,8 @@ class PingBroadcaster(threading.Thread):
             delay_override=None, # No delay override needed for SET_TIME
             destination_node_id=source_node_id # Target the specific node
         )
-        self.logger.debug(f"Sent SET_TIME command to {source_node_id:#04x} with value {target_time_ms_24bit} (Target epoch ms: {target_device_time_ms})")
+        self.logger.debug("Sent SET_TIME command to %#04x with value %s (Target epoch ms: %s)",
+                          source_node_id, target_time_ms_24bit, target_device_time_ms)
 
 
     def store_ping_send_time(self, ping_value_24bit: int, send_timestamp: float):
@@ -164,7 +164,7 @@ class PingBroadcaster(threading.Thread):
                  if key in self._pending_pings: # Check if key still exists
                       del self._pending_pings[key]
                       removed_count += 1
-             self.logger.debug(f"Pruned {removed_count} old PING entries.")
+             self.logger.debug("Pruned %d old PING entries.", removed_count)
 
     def get_rtt_estimate_ms(self, node_id: int) -> Optional[int]:
         """Gets the current estimated RTT in milliseconds for a given node ID."""
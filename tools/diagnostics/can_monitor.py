@@ -32,15 +32,24 @@ except ImportError as e:
 # Example: can0  123   [8]  11 22 33 44 55 66 77 88
 CANDUMP_PATTERN = re.compile(r'(\w+)\s+([0-9A-F]+)\s+\[\d+\]\s+([0-9A-F\s]+)')
 
+# Reverse (value -> name) maps per enum, keyed by id() since the enum wrappers are
+# module-level singletons; built on first use so each frame costs a dict lookup
+_enum_names = {}
+
 def get_enum_name(enum_obj, value, default="UNKNOWN"):
     """Get the name for an enum value from its EnumTypeWrapper object"""
     try:
         # Convert value to int to ensure proper lookup
         value = int(value)
-        # Try to find the name in the enum
-        for name, val in enum_obj.items():
-            if val == value:
-                return name
+        names = _enum_names.get(id(enum_obj))
+        if names is None:
+            names = {}
+            for name, val in enum_obj.items():
+                names.setdefault(val, name)  # First name wins for aliased values
+            _enum_names[id(enum_obj)] = names
+        name = names.get(value)
+        if name is not None:
+            return name
     except (AttributeError, ValueError, TypeError):
         pass
     return f"{default}({value})"
@@ -66,7 +66,8 @@ class CANSimulator:
         self.can_interface = CANInterfaceWrapper(
             node_id=node_id,
             channel=channel,
-            baudrate=500000
+            baudrate=500000,
+            protocol_registry=protocol_registry
         )
         
         # Get the list of component types for simulation
@@ -97,7 +98,7 @@ class CANSimulator:
         self.nav_route_type = random.choice(['circle', 'linear', 'random'])
         self.nav_route_radius = 0.01  # ~1km radius
         self.nav_linear_direction = random.uniform(0, 360)  # Random direction
-        self.nav_time_offset = time.time()  # Base time for simulation
+        self.nav_time_offset = time.monotonic()  # Base time for simulation
     
     def _simulate_random(self):
         """Generate random CAN messages across all components"""
@@ -287,7 +288,7 @@ class CANSimulator:
         # --- NAVIGATION simulation (staggered) ---
         if self.realistic_counter % 4 == 0: # Medium frequency
             # Update position based on time
-            elapsed_time = time.time() - self.nav_time_offset
+            elapsed_time = time.monotonic() - self.nav_time_offset
             angle = (elapsed_time * 15) % 360
             lat_base = 37.7749
             long_base = -122.4194
@@ -425,7 +426,7 @@ class CANSimulator:
     
     def _simulate_navigation(self):
         """Simulate navigation sensors including GPS, compass, etc."""
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed_time = current_time - self.nav_time_offset
         
         # Update navigation state based on route type
@@ -646,14 +647,14 @@ class CANSimulator:
             logger.error(f"Failed to start CAN interface processing: {e}")
             self.running = False # Don't proceed if processing fails
         # ------------------------------------
-        start_time = time.time()
+        start_time = time.monotonic()
         self.simulation_time = 0.0 # Reset simulation time
         
         msg_count = 0
         
         try:
             while self.running:
-                if duration and (time.time() - start_time) > duration:
+                if duration and (time.monotonic() - start_time) > duration:
                     logger.info(f"Simulation completed after {duration} seconds")
                     break
                     